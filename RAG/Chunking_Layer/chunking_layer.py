@@ -44,21 +44,182 @@ All nodes MUST include claim_id in metadata.
 """
 
 import re
+import sys
 import hashlib
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterator
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 from llama_index.core import Document
 from llama_index.core.schema import TextNode, IndexNode, BaseNode, NodeRelationship, RelatedNodeInfo
 
 
-@dataclass
+# Section heading detection (single pass over the whole text)
+# WHY: One multiline finditer replaces split('\n') + per-line regex/predicates
+# Each match spans exactly one line (leading/trailing whitespace excluded from groups):
+# - "section": a line containing "SECTION <id>" (case-insensitive), e.g. "SECTION 1 – ..."
+# - "caps": an ALL CAPS heading candidate, checked entirely in C:
+#   < 80 chars, 2-12 words, no ASCII lowercase, not ending with . , ; (not a sentence)
+#   (only str.isupper() is left to _detect_sections, for non-ASCII letters)
+_SECTION_RE = re.compile(
+    r'^[^\S\n]*(?:'
+    r'(?P<section>[^\n]*?(?i:SECTION)[^\S\n]+(?i:[A-Z0-9])+[^\n]*?)'
+    r'|(?=\S[^\n]{0,78}(?<=\S)[^\S\n]*$)'
+    r'(?P<caps>[^a-z\s]+(?:[^\S\n]+[^a-z\s]+){1,11})(?<![.,;])'
+    r')[^\S\n]*$',
+    re.MULTILINE,
+)
+
+# Documents shorter than this skip section detection entirely
+# WHY: 480 chars = one default child chunk (120 tokens * 4 chars); below that
+# sections cannot add retrieval structure, so the regex scan is wasted work.
+# Kept well under real claim forms (~1.2-1.3 KB), which still get their sections.
+_MIN_SECTION_DETECT_LEN = 480
+
+# Constant metadata values shared by every node
+# WHY: Interned once so all nodes reference the same string objects
+# (less memory per node, identity-fast equality in downstream filters)
+_UNKNOWN = sys.intern("unknown")
+_NODE_TYPE_SECTION = sys.intern("section")
+_NODE_TYPE_PARENT = sys.intern("parent_chunk")
+_NODE_TYPE_CHILD = sys.intern("child_chunk")
+_CHUNK_LEVEL_PARENT = sys.intern("parent")
+_CHUNK_LEVEL_CHILD = sys.intern("child")
+
+# Parent chunk feature detection
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4}')
+_TIME_RE = re.compile(r'\d{1,2}:\d{2}')
+_NUM_RE = re.compile(r'\d+')
+
+# Sentence boundary: sentence-ending punctuation followed by space and capital letter
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+
+
+def _pack_chunks(
+    token_counts: List[int],
+    max_tokens: int,
+    overlap_tokens: int = 0
+) -> List[Tuple[int, int]]:
+    """
+    Greedily pack consecutive units (sentences) into chunks of <= max_tokens.
+    
+    WHY INTEGER-ONLY:
+    - The packing decision only needs per-unit token counts
+    - Callers join unit text once per chunk, at the returned boundaries
+    - Plain ints in / index pairs out keeps this kernel compilable
+      (Cython/Numba) without touching the callers
+    
+    OVERLAP:
+    - When a chunk with more than one unit is flushed, its last unit is
+      carried into the next chunk if it fits within overlap_tokens
+    - overlap_tokens=0 disables overlap
+    
+    Args:
+        token_counts: Estimated tokens per unit, in order
+        max_tokens: Target maximum tokens per chunk
+        overlap_tokens: Maximum tokens of the carried-over unit
+    
+    Returns:
+        List of (first, last) unit index ranges (last is exclusive)
+    """
+    chunks = []
+    first = 0
+    size = 0
+    
+    for i, tokens in enumerate(token_counts):
+        # Adding this unit would exceed max size: flush current chunk
+        if size + tokens > max_tokens and i > first:
+            chunks.append((first, i))
+            
+            # Carry the previous unit over as overlap (if it is small enough)
+            if i - first > 1 and overlap_tokens > 0 and token_counts[i - 1] <= overlap_tokens:
+                first = i - 1
+                size = token_counts[i - 1] + tokens
+            else:
+                first = i
+                size = tokens
+        else:
+            size += tokens
+    
+    # Add final chunk
+    if first < len(token_counts):
+        chunks.append((first, len(token_counts)))
+    
+    return chunks
+
+
+def _validate_index_node(node: IndexNode) -> Optional[BaseNode]:
+    """
+    IndexNodes (sections) only need a non-empty title.
+    
+    WHY: IndexNodes are organizational, they only have titles
+    """
+    text = node.text
+    # isspace() is the allocation-free form of "not text.strip()"
+    if text and not text.isspace():
+        return node
+    return None
+
+
+def _validate_text_node(node: TextNode) -> Optional[BaseNode]:
+    """
+    TextNodes (parents/children) need real content; their text is trimmed.
+    """
+    # Skip empty nodes
+    raw_text = node.text
+    if not raw_text:
+        return None
+    
+    # Strip once and reuse the result for both checks below
+    text = raw_text.strip()
+    
+    # Skip very short nodes (< 10 characters)
+    # WHY: Too short to be useful, likely artifacts
+    if len(text) < 10:
+        return None
+    
+    # Trim whitespace from text
+    # WHY: Whitespace affects embeddings
+    # strip() returns the same object when there was nothing to trim,
+    # which is the common case for chunks built from stripped spans
+    if text is not raw_text:
+        node.text = text
+    return node
+
+
+def _validate_other_node(node: BaseNode) -> Optional[BaseNode]:
+    """
+    Fallback for node types missing from _NODE_VALIDATORS.
+    
+    WHY: Subclasses (e.g. a custom TextNode) still get their base class rules;
+    any other node type is kept as-is
+    """
+    if isinstance(node, IndexNode):
+        return _validate_index_node(node)
+    if isinstance(node, TextNode):
+        return _validate_text_node(node)
+    return node
+
+
+# Exact node type → validator (returns the node to keep, or None to drop it)
+# WHY: One type() + dict lookup per node instead of an isinstance() chain;
+# the pipeline only ever builds exact IndexNode / TextNode instances
+_NODE_VALIDATORS = {
+    IndexNode: _validate_index_node,
+    TextNode: _validate_text_node,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Section:
     """
     Represents a logical section of the document.
     
     WHY: Sections provide the top level of hierarchy.
     They enable context-aware retrieval within document structure.
+    
+    WHY SLOTS + FROZEN: No per-instance __dict__ (smaller, faster attribute
+    access), and sections are never modified after detection.
     """
     title: str
     text: str
@@ -99,6 +260,7 @@ class ChunkingPipeline:
         parent_chunk_overlap: int = 50,
         child_chunk_size: int = 120,
         child_chunk_overlap: int = 20,
+        max_workers: int = 1,
     ):
         """
         Initialize the chunking pipeline.
@@ -108,16 +270,20 @@ class ChunkingPipeline:
             parent_chunk_overlap: Overlap tokens for parent chunks (default 50)
             child_chunk_size: Target tokens for child chunks (default 120)
             child_chunk_overlap: Overlap tokens for child chunks (default 20)
+            max_workers: Threads used to process sections in parallel (default 1)
             
         WHY THESE DEFAULTS:
         - Parent 400 tokens ≈ 1-2 paragraphs, good semantic unit
         - Child 120 tokens ≈ 1-3 sentences, good atomic fact unit
         - Overlaps preserve context across boundaries
+        - max_workers=1: Section work is pure Python and mostly GIL-bound,
+          so threads only pay off on free-threaded builds or very large claims
         """
         self.parent_chunk_size = parent_chunk_size
         self.parent_chunk_overlap = parent_chunk_overlap
         self.child_chunk_size = child_chunk_size
         self.child_chunk_overlap = child_chunk_overlap
+        self.max_workers = max_workers
         
         # Simple token estimation: ~4 chars per token (English average)
         # WHY: Avoids expensive tokenizer calls during chunking
@@ -145,10 +311,32 @@ class ChunkingPipeline:
         - Preserves all hierarchical relationships
         - All nodes scoped to this ONE claim
         """
+        # Read the document metadata dict once; every lookup below reuses it
+        doc_meta = claim_document.metadata
+        
         # Extract claim_id from document metadata
         # WHY: All nodes must carry claim_id for filtering
-        claim_id = claim_document.metadata.get('claim_id', claim_document.doc_id)
-        claim_number = claim_document.metadata.get('claim_number', 'unknown')
+        claim_id = doc_meta.get('claim_id', claim_document.doc_id)
+        claim_number = doc_meta.get('claim_number', _UNKNOWN)
+        
+        # Claim-scoped metadata shared by EVERY node of this claim
+        # WHY: Built once per claim instead of re-reading document metadata per node
+        # Node-specific keys are placed first, these are appended to each node's metadata
+        base_metadata = {
+            # Claim-specific metadata (CRITICAL)
+            "claim_id": claim_id,
+            "claim_number": claim_number,
+            "claimant_name": doc_meta.get("claimant_name"),  # DYNAMIC! No hardcoding!
+            # Carry over document-level metadata
+            "document_id": claim_document.doc_id,
+            "document_type": doc_meta.get("document_type", _UNKNOWN),
+            "source_type": doc_meta.get("source_type", _UNKNOWN),
+        }
+        
+        # Claim context prepended to every parent/child chunk text
+        # WHY: Identical for all chunks of this claim, so format it once
+        claim_title = doc_meta.get("title", f"AUTO CLAIM FORM #{claim_number}")
+        claim_prefix = f"CLAIM NUMBER: {claim_number}\n{claim_title}\n"
         
         # Stage 1: Detect sections WITHIN THIS CLAIM
         # WHY: Sections provide logical structure within the claim
@@ -156,52 +344,40 @@ class ChunkingPipeline:
         
         # Stage 2-5: Build hierarchy
         # WHY: Each stage has a clear responsibility
-        all_nodes = []
-        
-        for section_idx, section in enumerate(sections):
-            # Create section node (claim-scoped)
-            section_node = self._create_section_node(
-                section=section,
-                document=claim_document,
-                claim_id=claim_id,
-                claim_number=claim_number
-            )
-            all_nodes.append(section_node)
-            
-            # Build parent chunks for this section (claim-scoped)
-            parent_nodes = self._build_parent_chunks(
+        # WHY PER-SECTION: Sections are independent, so they can run in parallel
+        def process(section: Section) -> Tuple[IndexNode, List[TextNode], List[TextNode]]:
+            return self._process_section(
                 section=section,
-                section_node=section_node,
                 document=claim_document,
-                claim_id=claim_id,
-                claim_number=claim_number
+                base_metadata=base_metadata,
+                claim_prefix=claim_prefix
             )
-            
-            # Build child chunks for each parent (claim-scoped)
-            for parent_node in parent_nodes:
-                child_nodes = self._build_child_chunks(
-                    parent_node=parent_node,
-                    section_node=section_node,
-                    document=claim_document,
-                    claim_id=claim_id,
-                    claim_number=claim_number
-                )
-                
-                # Link parent to children
-                parent_node.relationships[NodeRelationship.CHILD] = [
-                    RelatedNodeInfo(node_id=child.node_id)
-                    for child in child_nodes
-                ]
-                
-                all_nodes.extend(child_nodes)
-            
-            # Link section to parents
-            section_node.relationships[NodeRelationship.CHILD] = [
-                RelatedNodeInfo(node_id=parent.node_id)
-                for parent in parent_nodes
-            ]
-            
-            all_nodes.extend(parent_nodes)
+        
+        if self.max_workers > 1 and len(sections) > 1:
+            # map() preserves section order → deterministic output
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(sections))) as executor:
+                results = list(executor.map(process, sections))
+        else:
+            results = [process(section) for section in sections]
+        
+        # Nodes are collected per level and concatenated once at the end
+        # WHY: One final allocation, and nodes of the same level stay contiguous
+        section_nodes = []
+        all_parent_nodes = []
+        all_child_nodes = []
+        
+        for section_node, parent_nodes, child_nodes in results:
+            section_nodes.append(section_node)
+            all_parent_nodes.extend(parent_nodes)
+            all_child_nodes.extend(child_nodes)
+        
+        # Link sections → parents and parents → children in bulk
+        # WHY: Hierarchy is complete here, one pass per level
+        self._link_children(section_nodes, all_parent_nodes)
+        self._link_children(all_parent_nodes, all_child_nodes)
+        
+        # Order: Sections → Parent chunks → Child chunks
+        all_nodes = section_nodes + all_parent_nodes + all_child_nodes
         
         # Stage 6: Clean and validate
         # WHY: Remove empty/invalid chunks, ensure deterministic output
@@ -209,6 +385,83 @@ class ChunkingPipeline:
         
         return all_nodes
     
+    def _process_section(
+        self,
+        section: Section,
+        document: Document,
+        base_metadata: Dict,
+        claim_prefix: str
+    ) -> Tuple[IndexNode, List[TextNode], List[TextNode]]:
+        """
+        Build the full node hierarchy for ONE section.
+        
+        WHY SEPARATE METHOD:
+        - Section → Parents → Children is independent of other sections
+        - Enables parallel processing in build_nodes
+        
+        Args:
+            section: Section to process
+            document: Original document
+            base_metadata: Claim-scoped metadata shared by all nodes
+            claim_prefix: Claim context prepended to chunk text
+        
+        Returns:
+            Tuple of (section_node, parent_nodes, child_nodes)
+        """
+        # Create section node (claim-scoped)
+        section_node = self._create_section_node(
+            section=section,
+            document=document,
+            base_metadata=base_metadata
+        )
+        
+        # Build parent chunks for this section (claim-scoped)
+        parent_nodes = self._build_parent_chunks(
+            section=section,
+            section_node=section_node,
+            document=document,
+            base_metadata=base_metadata,
+            claim_prefix=claim_prefix
+        )
+        
+        # Build child chunks for each parent (claim-scoped)
+        # NOTE: Downward (CHILD) links are stitched later by _link_children
+        all_child_nodes = []
+        for parent_node in parent_nodes:
+            child_nodes = self._build_child_chunks(
+                parent_node=parent_node,
+                section_node=section_node,
+                document=document,
+                base_metadata=base_metadata,
+                claim_prefix=claim_prefix
+            )
+            all_child_nodes.extend(child_nodes)
+        
+        return section_node, parent_nodes, all_child_nodes
+    
+    def _link_children(self, parents: List[BaseNode], children: List[BaseNode]) -> None:
+        """
+        Set CHILD relationships on parents from their children's PARENT links.
+        
+        WHY: Every child already points up to its parent, so the downward
+        links can be built in one pass once all nodes exist.
+        Children keep their creation order; parents without children get [].
+        
+        Args:
+            parents: Nodes to receive CHILD relationships
+            children: Nodes with PARENT relationships pointing into parents
+        """
+        children_by_parent: Dict[str, List[RelatedNodeInfo]] = {
+            parent.node_id: [] for parent in parents
+        }
+        
+        for child in children:
+            parent_id = child.relationships[NodeRelationship.PARENT].node_id
+            children_by_parent[parent_id].append(RelatedNodeInfo(node_id=child.node_id))
+        
+        for parent in parents:
+            parent.relationships[NodeRelationship.CHILD] = children_by_parent[parent.node_id]
+    
     def _detect_sections(self, document: Document) -> List[Section]:
         """
         Stage 1: Section Detection
@@ -246,48 +499,49 @@ class ChunkingPipeline:
                 position_index=0
             )]
         
-        # Pattern 1: SECTION keywords
-        # Matches: "SECTION 1", "SECTION A", "SECTION 1 –", etc.
-        section_pattern = r'SECTION\s+[A-Z0-9]+[^\n]*'
+        # Short-circuit: tiny documents become one default section
+        if len(text) < _MIN_SECTION_DETECT_LEN:
+            return [Section(
+                title="Document",
+                text=text.strip(),
+                start_char=0,
+                end_char=len(text),
+                position_index=0
+            )]
         
-        # Find all potential section markers
-        lines = text.split('\n')
-        section_markers = []
+        # Find all potential section markers in ONE pass
+        # WHY: match.start() is the line start, so no line-position bookkeeping
+        # Markers are kept as parallel lists (titles / start offsets)
+        marker_titles = []
+        marker_starts = []
         
-        for i, line in enumerate(lines):
-            line_stripped = line.strip()
+        for match in _SECTION_RE.finditer(text):
+            # Pattern 1: SECTION keywords
+            # Matches: "SECTION 1", "SECTION A", "SECTION 1 –", etc.
+            title = match.group('section')
             
-            # Skip empty lines
-            if not line_stripped:
-                continue
+            # Pattern 2: ALL CAPS heading (short, < 80 chars, multiple words)
+            # Length, word count and punctuation are already enforced by _SECTION_RE
+            if title is None:
+                title = match.group('caps')
+                if not title.isupper():
+                    continue
             
-            # Check for SECTION keyword (case-insensitive for robustness)
-            if re.search(section_pattern, line_stripped, re.IGNORECASE):
-                section_markers.append((i, line_stripped, 'section'))
-            # Check for ALL CAPS heading (short, < 80 chars, multiple words)
-            elif (len(line_stripped) < 80 and 
-                  line_stripped.isupper() and 
-                  len(line_stripped.split()) >= 2 and
-                  len(line_stripped.split()) <= 12 and
-                  not line_stripped.endswith(('.', ',', ';'))):  # Not a sentence
-                section_markers.append((i, line_stripped, 'caps'))
+            marker_titles.append(title)
+            marker_starts.append(match.start())
         
         # If we found section markers, use them
-        if section_markers:
+        if marker_starts:
             sections = []
             
-            for idx, (line_num, title, marker_type) in enumerate(section_markers):
-                # Find start and end positions in original text
-                # WHY: We need character positions for metadata
-                start_pos = self._find_line_position(text, line_num)
-                
-                # End position is at next section or end of document
-                if idx + 1 < len(section_markers):
-                    next_line_num = section_markers[idx + 1][0]
-                    end_pos = self._find_line_position(text, next_line_num)
-                else:
-                    end_pos = len(text)
-                
+            # End position is at next section or end of document
+            # WHY: We need character positions for metadata
+            marker_ends = marker_starts[1:]
+            marker_ends.append(len(text))
+            
+            for idx, (title, start_pos, end_pos) in enumerate(
+                zip(marker_titles, marker_starts, marker_ends)
+            ):
                 section_text = text[start_pos:end_pos].strip()
                 
                 # Only add if section has content
@@ -315,24 +569,11 @@ class ChunkingPipeline:
             position_index=0
         )]
     
-    def _find_line_position(self, text: str, line_num: int) -> int:
-        """
-        Find character position of a line number in text.
-        
-        WHY: We need char positions for section boundaries.
-        """
-        lines = text.split('\n')
-        pos = 0
-        for i in range(min(line_num, len(lines))):
-            pos += len(lines[i]) + 1  # +1 for newline
-        return pos
-    
     def _create_section_node(
         self, 
         section: Section, 
         document: Document,
-        claim_id: str,
-        claim_number: str
+        base_metadata: Dict
     ) -> IndexNode:
         """
         Create an IndexNode for a section.
@@ -345,6 +586,7 @@ class ChunkingPipeline:
         Args:
             section: Section object
             document: Original document
+            base_metadata: Claim-scoped metadata shared by all nodes
             
         Returns:
             IndexNode with section metadata
@@ -368,14 +610,9 @@ class ChunkingPipeline:
                 "start_char_index": section.start_char,
                 "end_char_index": section.end_char,
                 "token_length": token_length,
-                "node_type": "section",
-                # Claim-specific metadata (CRITICAL)
-                "claim_id": claim_id,
-                "claim_number": claim_number,
-                # Carry over document-level metadata
-                "document_id": document.doc_id,
-                "document_type": document.metadata.get("document_type", "unknown"),
-                "source_type": document.metadata.get("source_type", "unknown"),
+                "node_type": _NODE_TYPE_SECTION,
+                # Claim-specific + document-level metadata (CRITICAL)
+                **base_metadata,
             }
         )
         
@@ -389,8 +626,8 @@ class ChunkingPipeline:
         section: Section,
         section_node: IndexNode,
         document: Document,
-        claim_id: str,
-        claim_number: str
+        base_metadata: Dict,
+        claim_prefix: str
     ) -> List[TextNode]:
         """
         Stage 2: Parent Chunking
@@ -411,6 +648,8 @@ class ChunkingPipeline:
             section: Section to chunk
             section_node: Section's IndexNode
             document: Original document
+            base_metadata: Claim-scoped metadata shared by all nodes
+            claim_prefix: Claim context prepended to chunk text
             
         Returns:
             List of TextNode objects (parent chunks)
@@ -419,15 +658,20 @@ class ChunkingPipeline:
         
         # Split by paragraphs first
         # WHY: Paragraphs are natural semantic boundaries
-        paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
+        # Each paragraph is stripped once (map) and empty ones dropped
+        paragraphs = [p for p in map(str.strip, text.split('\n\n')) if p]
         
         parent_chunks = []
         current_chunk = []
         current_size = 0
         position_index = 0
         
+        # Token estimates are inlined (same formula as _estimate_tokens)
+        # WHY: Avoids a method call per paragraph/sentence in the packing loop
+        chars_per_token = self.chars_per_token
+        
         for para in paragraphs:
-            para_tokens = self._estimate_tokens(para)
+            para_tokens = max(1, len(para) // chars_per_token)
             
             # If this paragraph alone exceeds max size, split it
             if para_tokens > self.parent_chunk_size:
@@ -440,26 +684,12 @@ class ChunkingPipeline:
                     current_size = 0
                 
                 # Split large paragraph by sentences
-                sentences = self._split_sentences(para)
-                sent_chunk = []
-                sent_size = 0
+                # WHY SPANS: Sentence text is only sliced when a chunk is flushed
+                spans = list(self._iter_sentence_spans(para))
+                sent_tokens = [max(1, (end - start) // chars_per_token) for start, end in spans]
                 
-                for sent in sentences:
-                    sent_tokens = self._estimate_tokens(sent)
-                    if sent_size + sent_tokens > self.parent_chunk_size and sent_chunk:
-                        # Flush sentence chunk
-                        chunk_text = ' '.join(sent_chunk)
-                        parent_chunks.append((chunk_text, position_index))
-                        position_index += 1
-                        sent_chunk = []
-                        sent_size = 0
-                    
-                    sent_chunk.append(sent)
-                    sent_size += sent_tokens
-                
-                # Add remaining sentences
-                if sent_chunk:
-                    chunk_text = ' '.join(sent_chunk)
+                for first, last in _pack_chunks(sent_tokens, self.parent_chunk_size):
+                    chunk_text = ' '.join(para[s:e] for s, e in spans[first:last])
                     parent_chunks.append((chunk_text, position_index))
                     position_index += 1
             
@@ -491,8 +721,8 @@ class ChunkingPipeline:
                 section_node=section_node,
                 position_index=pos_idx,
                 document=document,
-                claim_id=claim_id,
-                claim_number=claim_number
+                base_metadata=base_metadata,
+                claim_prefix=claim_prefix
             )
             parent_nodes.append(node)
         
@@ -505,15 +735,15 @@ class ChunkingPipeline:
         section_node: IndexNode,
         position_index: int,
         document: Document,
-        claim_id: str,
-        claim_number: str
+        base_metadata: Dict,
+        claim_prefix: str
     ) -> TextNode:
         """
         Create a TextNode for a parent chunk.
         
         WHY TEXTNODE:
         - TextNode contains actual text for embedding/retrieval
-        - Used by both VectorStoreIndex and SummaryIndex
+        - Embedded and stored in the VectorStoreIndex
         
         Args:
             text: Parent chunk text
@@ -521,6 +751,8 @@ class ChunkingPipeline:
             section_node: Section's IndexNode
             position_index: Position within section
             document: Original document
+            base_metadata: Claim-scoped metadata shared by all nodes
+            claim_prefix: Claim context prepended to chunk text
             
         Returns:
             TextNode with parent chunk metadata
@@ -535,19 +767,20 @@ class ChunkingPipeline:
         
         # Extract semantic features
         # WHY: Helps with debugging and potential filtering
-        contains_dates = bool(re.search(r'\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{2,4}', text))
-        contains_times = bool(re.search(r'\d{1,2}:\d{2}', text))
-        contains_numbers = bool(re.search(r'\d+', text))
+        # Dates and times both require a digit, so skip their scans when there is none
+        contains_numbers = bool(_NUM_RE.search(text))
+        contains_dates = contains_numbers and bool(_DATE_RE.search(text))
+        contains_times = contains_numbers and bool(_TIME_RE.search(text))
         
         # Simple topic extraction (first few words)
-        words = text.split()[:5]
-        semantic_topic = ' '.join(words) + ('...' if len(text.split()) > 5 else '')
+        # WHY maxsplit=5: Stops after the 6th word instead of splitting the whole chunk
+        words = text.split(None, 5)
+        semantic_topic = ' '.join(words[:5]) + ('...' if len(words) > 5 else '')
         
         # Prepend claim context to parent chunk text for better semantic matching
         # WHY: Enables queries like "claim number 1" to match correctly
         # Make claim number VERY prominent for better matching
-        claim_title = document.metadata.get("title", f"AUTO CLAIM FORM #{claim_number}")
-        contextualized_text = f"CLAIM NUMBER: {claim_number}\n{claim_title}\n{text}"
+        contextualized_text = claim_prefix + text
         
         # Create TextNode
         node = TextNode(
@@ -555,22 +788,16 @@ class ChunkingPipeline:
             metadata={
                 "parent_id": parent_id,
                 "section_id": section_node.node_id,
-                "chunk_level": "parent",
+                "chunk_level": _CHUNK_LEVEL_PARENT,
                 "position_index": position_index,
                 "token_length": token_length,
                 "semantic_topic": semantic_topic,
                 "contains_dates": contains_dates,
                 "contains_times": contains_times,
                 "contains_numbers": contains_numbers,
-                "node_type": "parent_chunk",
-                # Claim-specific metadata (CRITICAL)
-                "claim_id": claim_id,
-                "claim_number": claim_number,
-                "claimant_name": document.metadata.get("claimant_name"),  # DYNAMIC! No hardcoding!
-                # Carry over document-level metadata
-                "document_id": document.doc_id,
-                "document_type": document.metadata.get("document_type", "unknown"),
-                "source_type": document.metadata.get("source_type", "unknown"),
+                "node_type": _NODE_TYPE_PARENT,
+                # Claim-specific + document-level metadata (CRITICAL)
+                **base_metadata,
             }
         )
         
@@ -590,8 +817,8 @@ class ChunkingPipeline:
         parent_node: TextNode,
         section_node: IndexNode,
         document: Document,
-        claim_id: str,
-        claim_number: str
+        base_metadata: Dict,
+        claim_prefix: str
     ) -> List[TextNode]:
         """
         Stage 3: Child Chunking
@@ -616,53 +843,43 @@ class ChunkingPipeline:
             parent_node: Parent TextNode to split
             section_node: Section containing this parent
             document: Original document
+            base_metadata: Claim-scoped metadata shared by all nodes
+            claim_prefix: Claim context prepended to chunk text
             
         Returns:
             List of TextNode objects (child chunks)
         """
         text = parent_node.text
         
+        # Fast path: parent already fits in ONE child chunk
+        # WHY: Skips sentence splitting and packing for short parents
+        # (common near section boundaries); the single child is the parent text
+        if len(text) <= self.child_chunk_size * self.chars_per_token:
+            return [self._create_child_node(
+                text=text,
+                parent_node=parent_node,
+                section_node=section_node,
+                position_index=0,
+                document=document,
+                base_metadata=base_metadata,
+                claim_prefix=claim_prefix
+            )]
+        
         # Split into sentences first
         # WHY: Sentences are natural atomic fact boundaries
-        sentences = self._split_sentences(text)
+        # Sentences are (start, end) spans into text, sliced only on flush
+        spans = list(self._iter_sentence_spans(text))
+        chars_per_token = self.chars_per_token
+        sent_tokens = [max(1, (end - start) // chars_per_token) for start, end in spans]
         
+        # Pack sentences into chunks, keeping the last sentence as overlap
+        # WHY: Overlap preserves context across boundaries
         child_chunks = []
-        current_chunk = []
-        current_size = 0
-        position_index = 0
-        
-        for sent in sentences:
-            sent_tokens = self._estimate_tokens(sent)
-            
-            # If adding this sentence would exceed max size, flush current chunk
-            if current_size + sent_tokens > self.child_chunk_size and current_chunk:
-                chunk_text = ' '.join(current_chunk)
-                child_chunks.append((chunk_text, position_index))
-                position_index += 1
-                
-                # Apply overlap: keep last sentence for context
-                # WHY: Overlap preserves context across boundaries
-                if len(current_chunk) > 1 and self.child_chunk_overlap > 0:
-                    overlap_sent = current_chunk[-1]
-                    overlap_tokens = self._estimate_tokens(overlap_sent)
-                    if overlap_tokens <= self.child_chunk_overlap:
-                        current_chunk = [overlap_sent, sent]
-                        current_size = overlap_tokens + sent_tokens
-                    else:
-                        current_chunk = [sent]
-                        current_size = sent_tokens
-                else:
-                    current_chunk = [sent]
-                    current_size = sent_tokens
-            
-            # Otherwise, add sentence to current chunk
-            else:
-                current_chunk.append(sent)
-                current_size += sent_tokens
         
-        # Add final chunk
-        if current_chunk:
-            chunk_text = ' '.join(current_chunk)
+        for position_index, (first, last) in enumerate(
+            _pack_chunks(sent_tokens, self.child_chunk_size, self.child_chunk_overlap)
+        ):
+            chunk_text = ' '.join(text[s:e] for s, e in spans[first:last])
             child_chunks.append((chunk_text, position_index))
         
         # Create TextNode objects for child chunks
@@ -675,8 +892,8 @@ class ChunkingPipeline:
                 section_node=section_node,
                 position_index=pos_idx,
                 document=document,
-                claim_id=claim_id,
-                claim_number=claim_number
+                base_metadata=base_metadata,
+                claim_prefix=claim_prefix
             )
             child_nodes.append(node)
         
@@ -689,8 +906,8 @@ class ChunkingPipeline:
         section_node: IndexNode,
         position_index: int,
         document: Document,
-        claim_id: str,
-        claim_number: str
+        base_metadata: Dict,
+        claim_prefix: str
     ) -> TextNode:
         """
         Create a TextNode for a child chunk.
@@ -706,6 +923,8 @@ class ChunkingPipeline:
             section_node: Section IndexNode
             position_index: Position within parent
             document: Original document
+            base_metadata: Claim-scoped metadata shared by all nodes
+            claim_prefix: Claim context prepended to chunk text
             
         Returns:
             TextNode with child chunk metadata
@@ -722,8 +941,7 @@ class ChunkingPipeline:
         # WHY: Enables queries like "claim number 1" to match correctly
         # The claim form identifier is included in the embedding
         # Make claim number VERY prominent for better matching
-        claim_title = document.metadata.get("title", f"AUTO CLAIM FORM #{claim_number}")
-        contextualized_text = f"CLAIM NUMBER: {claim_number}\n{claim_title}\n{text}"
+        contextualized_text = claim_prefix + text
         
         # Create TextNode
         node = TextNode(
@@ -732,19 +950,13 @@ class ChunkingPipeline:
                 "chunk_id": child_id,
                 "parent_id": parent_node.node_id,
                 "section_id": section_node.node_id,
-                "chunk_level": "child",
+                "chunk_level": _CHUNK_LEVEL_CHILD,
                 "position_index": position_index,
                 "token_length": token_length,
                 "is_atomic_facts_unit": True,  # Critical for retrieval strategy
-                "node_type": "child_chunk",
-                # Claim-specific metadata (CRITICAL)
-                "claim_id": claim_id,
-                "claim_number": claim_number,
-                "claimant_name": document.metadata.get("claimant_name"),  # DYNAMIC! No hardcoding!
-                # Carry over document-level metadata
-                "document_id": document.doc_id,
-                "document_type": document.metadata.get("document_type", "unknown"),
-                "source_type": document.metadata.get("source_type", "unknown"),
+                "node_type": _NODE_TYPE_CHILD,
+                # Claim-specific + document-level metadata (CRITICAL)
+                **base_metadata,
             }
         )
         
@@ -765,11 +977,13 @@ class ChunkingPipeline:
         
         return node
     
-    def _split_sentences(self, text: str) -> List[str]:
+    def _iter_sentence_spans(self, text: str) -> Iterator[Tuple[int, int]]:
         """
-        Split text into sentences.
+        Split text into sentences, yielding (start, end) spans into text.
         
         WHY: Sentences are natural boundaries for atomic facts.
+        WHY SPANS: Callers slice and join sentence text only when a chunk
+        is finalized, so no intermediate list of substrings is built.
         
         Uses simple regex-based splitting.
         Good enough for most English text.
@@ -777,17 +991,23 @@ class ChunkingPipeline:
         Args:
             text: Text to split
             
-        Returns:
-            List of sentences
+        Yields:
+            (start, end) character offsets of each non-empty, stripped sentence
         """
+        # Strip the text once: separators consume all whitespace between
+        # sentences, so only the outer edges can carry whitespace
+        end = len(text.rstrip())
+        pos = len(text) - len(text.lstrip())
+        if pos >= end:
+            return
+        
         # Split on sentence-ending punctuation followed by space and capital letter
         # WHY: Handles most common cases without expensive NLP
-        sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', text)
-        
-        # Clean up
-        sentences = [s.strip() for s in sentences if s.strip()]
+        for match in _SENT_SPLIT_RE.finditer(text, pos, end):
+            yield pos, match.start()
+            pos = match.end()
         
-        return sentences
+        yield pos, end
     
     def _estimate_tokens(self, text: str) -> int:
         """
@@ -816,13 +1036,17 @@ class ChunkingPipeline:
         - Enables reproducible indexing
         - Critical for production systems
         
+        WHY BLAKE2B (digest_size=8):
+        - IDs are not security-sensitive, only need to be stable and unique
+        - Faster than sha256 on short strings, and no hex truncation needed
+        
         Args:
             text: Text to hash
             
         Returns:
             16-character hex string
         """
-        return hashlib.sha256(text.encode()).hexdigest()[:16]
+        return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
     
     def _clean_and_validate_nodes(self, nodes: List[BaseNode]) -> List[BaseNode]:
         """
@@ -841,41 +1065,18 @@ class ChunkingPipeline:
         Returns:
             Cleaned and validated list of nodes
         """
-        cleaned = []
-        
-        for node in nodes:
-            # Ensure node has ID (required for all nodes)
-            if not node.node_id:
-                continue
-            
-            # For IndexNodes (sections), we only need non-empty text (title)
-            # WHY: IndexNodes are organizational, they only have titles
-            if isinstance(node, IndexNode):
-                if node.text and node.text.strip():
-                    cleaned.append(node)
-                continue
-            
-            # For TextNodes (parents/children), validate text content
-            if isinstance(node, TextNode):
-                # Skip empty nodes
-                if not node.text or not node.text.strip():
-                    continue
-                
-                # Skip very short nodes (< 10 characters)
-                # WHY: Too short to be useful, likely artifacts
-                if len(node.text.strip()) < 10:
-                    continue
-                
-                # Trim whitespace from text
-                # WHY: Whitespace affects embeddings
-                node.text = node.text.strip()
-                cleaned.append(node)
-                continue
-            
-            # For any other node type, just add it
-            cleaned.append(node)
-        
-        return cleaned
+        validators = _NODE_VALIDATORS
+        
+        # One comprehension instead of an append loop
+        # WHY: Most nodes survive, and LIST_APPEND skips the per-node method call
+        # - Nodes without an ID are dropped (required for all nodes)
+        # - Everything else is dispatched on its exact type (see _NODE_VALIDATORS)
+        return [
+            kept
+            for node in nodes
+            if node.node_id
+            and (kept := validators.get(type(node), _validate_other_node)(node)) is not None
+        ]
 
 
 # Production-ready factory function
@@ -884,6 +1085,7 @@ def create_chunking_pipeline(
     parent_chunk_overlap: int = 50,
     child_chunk_size: int = 120,
     child_chunk_overlap: int = 20,
+    max_workers: int = 1,
 ) -> ChunkingPipeline:
     """
     Factory function to create a configured chunking pipeline.
@@ -895,6 +1097,7 @@ def create_chunking_pipeline(
         parent_chunk_overlap: Overlap tokens for parent chunks
         child_chunk_size: Target tokens for child chunks
         child_chunk_overlap: Overlap tokens for child chunks
+        max_workers: Threads used to process sections in parallel
         
     Returns:
         Configured ChunkingPipeline instance
@@ -904,5 +1107,6 @@ def create_chunking_pipeline(
         parent_chunk_overlap=parent_chunk_overlap,
         child_chunk_size=child_chunk_size,
         child_chunk_overlap=child_chunk_overlap,
+        max_workers=max_workers,
     )
 
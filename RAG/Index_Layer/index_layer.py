@@ -23,7 +23,6 @@ INPUT:
 
 OUTPUT:
 - VectorStoreIndex (FAISS)
-- SummaryIndex
 - Retrievers (Needle, Summary)
 - Save/Load methods
 
@@ -57,27 +56,436 @@ Violating this rule INVALIDATES the entire system.
 
 import os
 import json
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import ClassVar, List, Optional, Dict, Tuple
 
 import faiss  # type: ignore[import]
+import numpy as np
 from llama_index.core import (
     VectorStoreIndex,
-    SummaryIndex,
     StorageContext,
     load_index_from_storage,
     get_response_synthesizer,
 )
-from llama_index.core.schema import BaseNode, TextNode, IndexNode
+from llama_index.core.schema import (
+    BaseNode,
+    TextNode,
+    IndexNode,
+    MetadataMode,
+    NodeWithScore,
+    QueryBundle,
+)
+from llama_index.core.async_utils import asyncio_run
 from llama_index.core.embeddings import BaseEmbedding
+from llama_index.core.graph_stores import SimpleGraphStore
+from llama_index.core.bridge.pydantic import Field, PrivateAttr
+from llama_index.core.vector_stores.simple import (
+    DEFAULT_PERSIST_FNAME,
+    DEFAULT_VECTOR_STORE,
+    NAMESPACE_SEP,
+)
 from llama_index.embeddings.openai import OpenAIEmbedding
 from llama_index.vector_stores.faiss import FaissVectorStore
-from llama_index.core.retrievers import VectorIndexRetriever, AutoMergingRetriever
+from llama_index.core.retrievers import (
+    BaseRetriever,
+    VectorIndexRetriever,
+    AutoMergingRetriever,
+)
 from llama_index.core.response_synthesizers import ResponseMode
 from llama_index.core.query_engine import RetrieverQueryEngine
 from llama_index.llms.openai import OpenAI as LlamaIndexOpenAI
 
 
+# FAISS index selection
+# WHY: Below a few thousand vectors, exact brute force (BLAS over a flat
+# index) is faster than walking an HNSW graph, and it is exact. Above that,
+# HNSW brings per-query cost down from O(N·d) to roughly O(log N).
+_HNSW_NODES_THRESHOLD = 2000
+_HNSW_M = 32                    # Graph neighbours per node
+_HNSW_EF_CONSTRUCTION = 200     # Build-time beam width (graph quality)
+_HNSW_EF_SEARCH = 64            # Default query-time beam width (recall vs latency)
+
+# Texts per OpenAI embeddings request
+# WHY: OpenAI caps a request at 2048 inputs AND 300k tokens. Parent chunks
+# are ~400 tokens, so 512 inputs stays under the token cap while still
+# cutting round-trips 5x compared to 100.
+_EMBED_BATCH_SIZE = 512
+
+# Persistent embedding cache (SQLite, keyed by sha256(model|dimensions|text))
+# WHY: Claim PDFs are re-indexed often (parameter tuning, rebuilds);
+# identical chunks should not be paid for twice
+_EMBEDDING_CACHE_PATH = str(Path.home() / ".cache" / "ragagent" / "embeddings.sqlite")
+_SQLITE_MAX_PARAMS = 500  # Keys per SELECT ... IN (...) (SQLite variable limit)
+
+# In-process LRU of query embeddings, keyed by (model, dimensions, query)
+# WHY: Agents repeat the same questions; a hit skips an OpenAI round-trip.
+# Module-level so it is shared by every embedding instance in the process.
+_QUERY_CACHE_SIZE = 4096
+_QUERY_EMBEDDING_CACHE: "OrderedDict[Tuple[str, Optional[int], str], List[float]]" = OrderedDict()
+_QUERY_CACHE_LOCK = threading.Lock()
+
+# File the default FAISS vector store is persisted to by StorageContext.persist
+# (a binary FAISS index, despite the .json extension)
+_FAISS_PERSIST_FNAME = f"{DEFAULT_VECTOR_STORE}{NAMESPACE_SEP}{DEFAULT_PERSIST_FNAME}"
+
+# Index format marker written to index_metadata.json by save()
+# WHY: Scores are inner products on L2-normalized vectors (cosine). An index
+# saved before that (IndexFlatL2, raw vectors) still loads, but its scores
+# are distances, so every threshold check would keep the WORST matches.
+# load() refuses any index whose marker is missing or different
+_INDEX_FORMAT = {"metric": "inner_product", "normalized": True}
+
+# FAISS read flags for load(mmap=True)
+# IO_FLAG_MMAP_IFC (FAISS >= 1.10) maps flat / HNSW vector codes zero-copy;
+# older builds only know IO_FLAG_MMAP. READ_ONLY: the mapping is never written
+_FAISS_MMAP_FLAGS = (
+    getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP) | faiss.IO_FLAG_READ_ONLY
+)
+
+
+# Optional scalar quantization of stored vectors
+# WHY: 1536-dim fp32 = 6 KB/vector. fp16 halves that with no measurable
+# recall loss on unit vectors; int8 quarters it but needs a training pass.
+_SQ_TYPES = {
+    "fp16": faiss.ScalarQuantizer.QT_fp16,
+    "int8": faiss.ScalarQuantizer.QT_8bit,
+}
+
+
+def _create_faiss_index(
+    dimension: int,
+    num_vectors: int,
+    nodes_threshold: int,
+    quantization: Optional[str] = None,
+):
+    """
+    Create the FAISS index that fits the number of vectors to store.
+    
+    WHY THIS EXISTS:
+    - Small claims: IndexFlatIP (exact, BLAS brute force, no graph overhead)
+    - Large claims: IndexHNSWFlat (sub-linear search)
+    - Both use inner product, so FaissVectorStore scores are similarities
+      (higher = better) that can be compared against a threshold
+    - Optional fp16/int8 storage via the ScalarQuantizer variants
+      (IndexScalarQuantizer / IndexHNSWSQ)
+    
+    Args:
+        dimension: Embedding dimension
+        num_vectors: Number of vectors that will be added
+        nodes_threshold: Vector count at which HNSW replaces brute force
+        quantization: None (fp32), "fp16" or "int8"
+    
+    Returns:
+        An empty FAISS index (int8 indexes still need train() before add())
+    """
+    if quantization is not None and quantization not in _SQ_TYPES:
+        raise ValueError(
+            f"Unknown quantization {quantization!r}. "
+            f"Expected None or one of: {', '.join(_SQ_TYPES)}"
+        )
+    
+    if num_vectors < nodes_threshold:
+        if quantization is None:
+            return faiss.IndexFlatIP(dimension)
+        return faiss.IndexScalarQuantizer(
+            dimension, _SQ_TYPES[quantization], faiss.METRIC_INNER_PRODUCT
+        )
+    
+    if quantization is None:
+        index = faiss.IndexHNSWFlat(dimension, _HNSW_M, faiss.METRIC_INNER_PRODUCT)
+    else:
+        index = faiss.IndexHNSWSQ(
+            dimension, _SQ_TYPES[quantization], _HNSW_M, faiss.METRIC_INNER_PRODUCT
+        )
+    index.hnsw.efConstruction = _HNSW_EF_CONSTRUCTION
+    index.hnsw.efSearch = _HNSW_EF_SEARCH
+    return index
+
+
+def _normalize_embeddings(embeddings: List[List[float]]) -> List[List[float]]:
+    """
+    L2-normalize a batch of embeddings in one FAISS call.
+    
+    WHY: On unit vectors, inner product == cosine similarity, so the
+    IndexFlatIP / HNSW-IP scores are true cosine scores in [-1, 1].
+    Zero vectors are left unchanged by faiss.normalize_L2.
+    """
+    if not embeddings:
+        return embeddings
+    
+    matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    faiss.normalize_L2(matrix)
+    return matrix.tolist()
+
+
+class NormalizedOpenAIEmbedding(OpenAIEmbedding):
+    """
+    OpenAIEmbedding that returns unit-length vectors.
+    
+    WHY THIS EXISTS:
+    - The FAISS indexes use inner product (see _create_faiss_index)
+    - Inner product only equals cosine similarity on unit vectors
+    - OpenAI embeddings are tuned for cosine similarity
+    - Normalizing BOTH documents and queries here keeps the
+      similarity_threshold meaningful (cosine, not raw dot product)
+    
+    CRITICAL:
+    - Same model, same API calls as OpenAIEmbedding
+    - Only post-processes the returned vectors
+    """
+    
+    def _get_query_embedding(self, query: str) -> List[float]:
+        return _normalize_embeddings([super()._get_query_embedding(query)])[0]
+    
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        return _normalize_embeddings([await super()._aget_query_embedding(query)])[0]
+    
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return _normalize_embeddings([super()._get_text_embedding(text)])[0]
+    
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        return _normalize_embeddings([await super()._aget_text_embedding(text)])[0]
+    
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return _normalize_embeddings(super()._get_text_embeddings(texts))
+    
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return _normalize_embeddings(await super()._aget_text_embeddings(texts))
+
+
+class CachedOpenAIEmbedding(NormalizedOpenAIEmbedding):
+    """
+    NormalizedOpenAIEmbedding with a persistent on-disk cache for document texts.
+    
+    WHY THIS EXISTS:
+    - build_indexes re-embeds identical chunks on every rebuild
+    - Each text is keyed by sha256(model|dimensions|text)
+    - Only cache misses are sent to OpenAI (still batched)
+    - Vectors are stored as float32 BLOBs in SQLite
+    - Query embeddings are kept in an in-process LRU (not on disk)
+    
+    CRITICAL:
+    - Model and dimensions are part of every key, so vectors from different
+      embedding configurations can never be mixed
+    """
+    
+    cache_path: str = Field(
+        default=_EMBEDDING_CACHE_PATH,
+        description="SQLite file holding cached document embeddings.",
+    )
+    
+    _cache_conn: Optional[sqlite3.Connection] = PrivateAttr(default=None)
+    _cache_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    
+    def _get_cache_conn(self) -> sqlite3.Connection:
+        """Open (once) the SQLite cache, creating the file and table if needed."""
+        if self._cache_conn is None:
+            Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vec BLOB)"
+            )
+            conn.commit()
+            self._cache_conn = conn
+        return self._cache_conn
+    
+    def _cache_key(self, text: str) -> str:
+        return hashlib.sha256(
+            f"{self.model}|{self.dimensions}|{text}".encode("utf-8")
+        ).hexdigest()
+    
+    def _cache_lookup(
+        self,
+        texts: List[str],
+    ) -> Tuple[List[str], List[Optional[List[float]]]]:
+        """
+        Look up cached vectors for texts.
+        
+        Returns:
+            (keys, vectors) where vectors[i] is None on a cache miss
+        """
+        keys = [self._cache_key(text) for text in texts]
+        found: Dict[str, bytes] = {}
+        
+        with self._cache_lock:
+            conn = self._get_cache_conn()
+            for start in range(0, len(keys), _SQLITE_MAX_PARAMS):
+                batch = keys[start:start + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                found.update(conn.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                ))
+        
+        vectors = [
+            np.frombuffer(found[key], dtype=np.float32).tolist() if key in found else None
+            for key in keys
+        ]
+        return keys, vectors
+    
+    def _cache_store(self, keys: List[str], vectors: List[List[float]]) -> None:
+        """Write freshly embedded vectors back to the cache."""
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in zip(keys, vectors)
+        ]
+        with self._cache_lock:
+            conn = self._get_cache_conn()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)", rows
+                )
+    
+    def _query_cache_get(self, query: str) -> Tuple[Tuple[str, Optional[int], str], Optional[List[float]]]:
+        """Look up a query embedding in the LRU (and mark it recently used)."""
+        key = (self.model, self.dimensions, query)
+        with _QUERY_CACHE_LOCK:
+            vector = _QUERY_EMBEDDING_CACHE.get(key)
+            if vector is not None:
+                _QUERY_EMBEDDING_CACHE.move_to_end(key)
+        return key, vector
+    
+    def _query_cache_put(self, key: Tuple[str, Optional[int], str], vector: List[float]) -> None:
+        with _QUERY_CACHE_LOCK:
+            _QUERY_EMBEDDING_CACHE[key] = vector
+            if len(_QUERY_EMBEDDING_CACHE) > _QUERY_CACHE_SIZE:
+                _QUERY_EMBEDDING_CACHE.popitem(last=False)
+    
+    def _get_query_embedding(self, query: str) -> List[float]:
+        key, vector = self._query_cache_get(query)
+        if vector is None:
+            vector = super()._get_query_embedding(query)
+            self._query_cache_put(key, vector)
+        # Copy so callers can never mutate the cached vector
+        return list(vector)
+    
+    async def _aget_query_embedding(self, query: str) -> List[float]:
+        key, vector = self._query_cache_get(query)
+        if vector is None:
+            vector = await super()._aget_query_embedding(query)
+            self._query_cache_put(key, vector)
+        return list(vector)
+    
+    def _get_text_embedding(self, text: str) -> List[float]:
+        return self._get_text_embeddings([text])[0]
+    
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        return (await self._aget_text_embeddings([text]))[0]
+    
+    def _get_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        keys, vectors = self._cache_lookup(texts)
+        misses = [i for i, vector in enumerate(vectors) if vector is None]
+        
+        if misses:
+            fresh = super()._get_text_embeddings([texts[i] for i in misses])
+            self._cache_store([keys[i] for i in misses], fresh)
+            for i, vector in zip(misses, fresh):
+                vectors[i] = vector
+        
+        return vectors
+    
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        keys, vectors = self._cache_lookup(texts)
+        misses = [i for i, vector in enumerate(vectors) if vector is None]
+        
+        if misses:
+            fresh = await super()._aget_text_embeddings([texts[i] for i in misses])
+            self._cache_store([keys[i] for i in misses], fresh)
+            for i, vector in zip(misses, fresh):
+                vectors[i] = vector
+        
+        return vectors
+
+
+class _MatrixRetriever(BaseRetriever):
+    """
+    Exact top-k retriever over an in-memory (N × d) float32 matrix.
+    
+    WHY THIS EXISTS:
+    - For small claims, one NumPy matrix-vector product (BLAS sgemv)
+      plus argpartition is all the search there is
+    - Skips the FaissVectorStore round-trip (list → array conversion,
+      FAISS call, id-map lookups) on every query
+    - Drop-in for VectorIndexRetriever: same query embedding, same
+      docstore nodes, same cosine scores
+    """
+    
+    def __init__(
+        self,
+        matrix: np.ndarray,
+        node_ids: List[str],
+        index: VectorStoreIndex,
+        similarity_top_k: int,
+    ):
+        super().__init__()
+        self._matrix = matrix
+        self._node_ids = node_ids
+        self._index = index
+        self._docstore = index.docstore
+        self._embed_model = index._embed_model
+        self._similarity_top_k = similarity_top_k
+    
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        if query_bundle.embedding is None:
+            query_bundle.embedding = self._embed_model.get_agg_embedding_from_queries(
+                query_bundle.embedding_strs
+            )
+        
+        query = np.asarray(query_bundle.embedding, dtype=np.float32)
+        scores = self._matrix @ query
+        
+        k = min(self._similarity_top_k, len(scores))
+        if k == 0:
+            return []
+        
+        # argpartition: O(N) selection, then sort only the k winners
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        
+        nodes = self._docstore.get_nodes([self._node_ids[i] for i in top])
+        return [
+            NodeWithScore(node=node, score=float(scores[i]))
+            for node, i in zip(nodes, top)
+        ]
+
+
+class _ScoreCutoffRetriever(BaseRetriever):
+    """
+    Drops hits below a similarity cutoff from a wrapped retriever.
+    
+    WHY THIS EXISTS:
+    - Sits BETWEEN the vector retriever and AutoMergingRetriever
+    - Low-score children are removed before merging, so they can no
+      longer promote an unrelated parent
+    - Merged parents (average of kept children) stay above the cutoff
+    """
+    
+    def __init__(self, retriever: BaseRetriever, similarity_cutoff: float):
+        super().__init__()
+        self._retriever = retriever
+        self._similarity_cutoff = similarity_cutoff
+    
+    def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        cutoff = self._similarity_cutoff
+        return [
+            n for n in self._retriever.retrieve(query_bundle)
+            if n.score is not None and n.score >= cutoff
+        ]
+    
+    async def _aretrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
+        cutoff = self._similarity_cutoff
+        return [
+            n for n in await self._retriever.aretrieve(query_bundle)
+            if n.score is not None and n.score >= cutoff
+        ]
+
+
 class IndexLayer:
     """
     Production-grade index layer for single-claim retrieval.
@@ -105,12 +513,23 @@ class IndexLayer:
     - NEVER recreated or overridden
     """
     
+    # Process-wide registries of embedding / LLM instances
+    # WHY: load_many() creates one IndexLayer per claim. Without sharing,
+    # each would open its own OpenAI client (HTTP pool, TLS sessions).
+    # Keyed by the configuration, so "ONE instance per configuration"
+    # holds across ALL IndexLayer instances, not just within one.
+    _embed_registry: ClassVar[Dict[Tuple[str, int, Optional[str]], BaseEmbedding]] = {}
+    _llm_registry: ClassVar[Dict[Tuple[str, float], LlamaIndexOpenAI]] = {}
+    _registry_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(
         self,
         embedding_model: str = "text-embedding-3-small",
         vector_dimension: int = 1536,
         llm_model: str = "gpt-4o-mini",
         llm_temperature: float = 0.2,
+        embedding_cache_path: Optional[str] = _EMBEDDING_CACHE_PATH,
+        faiss_threads: int = 1,
     ):
         """
         Initialize the index layer.
@@ -120,6 +539,9 @@ class IndexLayer:
             vector_dimension: Embedding dimension (1536 for text-embedding-3-small)
             llm_model: OpenAI LLM model for MapReduce synthesis
             llm_temperature: LLM temperature for synthesis (0.2 = coherent)
+            embedding_cache_path: SQLite file for cached document embeddings
+                                  (None disables the cache)
+            faiss_threads: OpenMP threads FAISS uses per search (default 1)
         
         WHY THESE DEFAULTS:
         - text-embedding-3-small: Good balance of quality and cost
@@ -127,11 +549,16 @@ class IndexLayer:
         - gpt-4o-mini: Fast, cheap, good for summarization
         - temperature=0.2: Coherent synthesis without creativity
         - Can be overridden for text-embedding-3-large (3072 dims)
+        - faiss_threads=1: A single query is tiny work; an OpenMP fan-out
+          over every core costs more than it saves. Parallelism comes from
+          concurrent queries instead (query_batch widens it temporarily)
         """
         self.embedding_model = embedding_model
         self.vector_dimension = vector_dimension
         self.llm_model = llm_model
         self.llm_temperature = llm_temperature
+        self.embedding_cache_path = embedding_cache_path
+        self.faiss_threads = faiss_threads
         
         # THE SINGLE EMBEDDING INSTANCE (created lazily)
         # WHY: Embedding creation requires OpenAI API key
@@ -145,7 +572,21 @@ class IndexLayer:
         
         # Indexes (created during build)
         self.vector_index: Optional[VectorStoreIndex] = None
-        self.summary_index: Optional[SummaryIndex] = None
+        
+        # Retrievers, built once per configuration and reused
+        # (needle: (top_k, similarity cutoff or None), summary: top_k)
+        # WHY: query_needle/query_summary run per agent query; rebuilding
+        # VectorIndexRetriever + AutoMergingRetriever each time is pure overhead
+        self._needle_retrievers: Dict[Tuple[int, Optional[float]], AutoMergingRetriever] = {}
+        self._summary_retrievers: Dict[int, BaseRetriever] = {}
+        
+        # In-memory vectors for the NumPy brute-force path (small claims)
+        # WHY: Row i is the embedding of node _matrix_node_ids[i]
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_node_ids: List[str] = []
+        self._matrix_rows: Dict[str, int] = {}
+        # ||x||² per row, computed once (d²(q,x) = ||q||² + ||x||² − 2·q·x)
+        self._norms_sq: Optional[np.ndarray] = None
         
         # Storage context (contains FAISS store + embedding)
         self.storage_context: Optional[StorageContext] = None
@@ -162,20 +603,42 @@ class IndexLayer:
         - Ensures embedding is created exactly once
         - Lazy initialization (only when needed)
         - Reuses same instance across all operations
+        - Shared with every IndexLayer that has the same configuration
         
         Returns:
-            The single OpenAIEmbedding instance
+            The single (L2-normalized) OpenAIEmbedding instance
         """
-        if self._embed_model is None:
+        if self._embed_model is not None:
+            return self._embed_model
+        
+        registry_key = (self.embedding_model, self.vector_dimension, self.embedding_cache_path)
+        with IndexLayer._registry_lock:
+            self._embed_model = IndexLayer._embed_registry.get(registry_key)
+            if self._embed_model is not None:
+                return self._embed_model
+            
             # Create THE SINGLE embedding instance
             # WHY: This is the ONLY embedding used in the entire system
-            self._embed_model = OpenAIEmbedding(
-                model=self.embedding_model,
-                embed_batch_size=100,  # Batch for efficiency
-            )
+            # Normalized so inner-product search scores are cosine similarities
+            # Cached on disk so rebuilds do not re-embed identical chunks
+            if self.embedding_cache_path is not None:
+                self._embed_model = CachedOpenAIEmbedding(
+                    model=self.embedding_model,
+                    embed_batch_size=_EMBED_BATCH_SIZE,  # Batch for efficiency
+                    cache_path=self.embedding_cache_path,
+                )
+            else:
+                self._embed_model = NormalizedOpenAIEmbedding(
+                    model=self.embedding_model,
+                    embed_batch_size=_EMBED_BATCH_SIZE,  # Batch for efficiency
+                )
             
             print(f"✅ Created embedding model: {self.embedding_model}")
+            if self.embedding_cache_path is not None:
+                print(f"   Embedding cache: {self.embedding_cache_path}")
             print(f"   This is the SINGLE embedding instance for all operations")
+            
+            IndexLayer._embed_registry[registry_key] = self._embed_model
         
         return self._embed_model
     
@@ -187,11 +650,20 @@ class IndexLayer:
         - Ensures LLM is created exactly once
         - Lazy initialization (only when needed)
         - Reuses same instance for all MapReduce operations
+        - Shared with every IndexLayer that has the same configuration
         
         Returns:
             The single LlamaIndexOpenAI instance
         """
-        if self._llm is None:
+        if self._llm is not None:
+            return self._llm
+        
+        registry_key = (self.llm_model, self.llm_temperature)
+        with IndexLayer._registry_lock:
+            self._llm = IndexLayer._llm_registry.get(registry_key)
+            if self._llm is not None:
+                return self._llm
+            
             # Create THE SINGLE LLM instance
             # WHY: Used by MapReduce response synthesizer
             self._llm = LlamaIndexOpenAI(
@@ -202,6 +674,8 @@ class IndexLayer:
             print(f"✅ Created LLM: {self.llm_model}")
             print(f"   Temperature: {self.llm_temperature}")
             print(f"   Used for: MapReduce summarization")
+            
+            IndexLayer._llm_registry[registry_key] = self._llm
         
         return self._llm
     
@@ -210,6 +684,9 @@ class IndexLayer:
         nodes: List[BaseNode],
         claim_id: Optional[str] = None,
         claim_number: Optional[str] = None,
+        nodes_threshold: int = _HNSW_NODES_THRESHOLD,
+        quantization: Optional[str] = None,
+        use_faiss: Optional[bool] = None,
     ) -> None:
         """
         Build all indexes for ONE claim's nodes.
@@ -221,11 +698,21 @@ class IndexLayer:
                    (from Chunking Layer)
             claim_id: Claim identifier (optional, extracted from nodes if not provided)
             claim_number: Claim number (optional)
+            nodes_threshold: Number of embedded nodes at which the FAISS
+                             index switches from exact brute force
+                             (IndexFlatIP) to HNSW (IndexHNSWFlat)
+            quantization: Store vectors as "fp16" (1/2 size) or "int8"
+                          (1/4 size, trained on this claim's vectors).
+                          None keeps exact fp32 vectors.
+            use_faiss: Search with FAISS (True) or with a NumPy matrix
+                       product over in-memory vectors (False). None picks
+                       NumPy below nodes_threshold. FAISS is built either
+                       way: it is what save() persists and load() restores.
         
         WHY THIS METHOD:
         - Centralizes all index building
         - Enforces embedding consistency
-        - Creates both vector and summary indexes
+        - Creates the vector index used by every retriever
         - Prepares retrievers
         """
         # Extract claim metadata
@@ -249,56 +736,208 @@ class IndexLayer:
         # WHY: This embedding will be used for ALL operations
         embed_model = self._get_or_create_embedding()
         
-        # Stage 2: Create FAISS vector store
+        # Stage 2: Filter nodes for vector indexing
+        # WHY: We want to index TextNodes (parent + child), not IndexNodes (sections)
+        # ONE pass, exact type() checks first (the chunking layer only emits
+        # plain TextNode and IndexNode); isinstance only for other subclasses
+        # NOTE: IndexNode subclasses TextNode, so it lands in text_nodes too
+        text_nodes = []
+        index_node_count = 0
+        for n in nodes:
+            node_type = type(n)
+            if node_type is TextNode:
+                text_nodes.append(n)
+            elif node_type is IndexNode or isinstance(n, IndexNode):
+                text_nodes.append(n)
+                index_node_count += 1
+            elif isinstance(n, TextNode):
+                text_nodes.append(n)
+        
+        print(f"   TextNodes: {len(text_nodes)} (will be embedded)")
+        print(f"   IndexNodes: {index_node_count} (structural only)")
+        
+        # Stage 3: Create FAISS vector store
         # WHY: FAISS is fast, efficient, and supports similarity search
-        faiss_index = faiss.IndexFlatL2(self.vector_dimension)
+        # Index type depends on how many vectors this claim will hold
+        faiss_index = _create_faiss_index(
+            dimension=self.vector_dimension,
+            num_vectors=len(text_nodes),
+            nodes_threshold=nodes_threshold,
+            quantization=quantization,
+        )
         vector_store = FaissVectorStore(faiss_index=faiss_index)
         
-        # Stage 3: Create StorageContext with embedding
+        # Pin FAISS's OpenMP thread count (process-wide setting)
+        faiss.omp_set_num_threads(self.faiss_threads)
+        
+        # Stage 4: Create StorageContext with embedding
         # WHY: StorageContext stores the embedding and vector store
         # All indexes created from this context will use the SAME embedding
         self.storage_context = StorageContext.from_defaults(
             vector_store=vector_store,
         )
         
-        print(f"✅ Created FAISS vector store (dimension: {self.vector_dimension})")
-        
-        # Stage 4: Filter nodes for vector indexing
-        # WHY: We want to index TextNodes (parent + child), not IndexNodes (sections)
-        text_nodes = [n for n in nodes if isinstance(n, TextNode)]
-        index_nodes = [n for n in nodes if isinstance(n, IndexNode)]
-        
-        print(f"   TextNodes: {len(text_nodes)} (will be embedded)")
-        print(f"   IndexNodes: {len(index_nodes)} (structural only)")
+        index_kind = "HNSW" if hasattr(faiss_index, "hnsw") else "Flat (exact)"
+        if quantization is not None:
+            index_kind = f"{index_kind}, {quantization} vectors"
+        print(f"✅ Created FAISS vector store (dimension: {self.vector_dimension}, index: {index_kind})")
+        
+        # Stage 5: Embed all text nodes in batched requests
+        # WHY: One explicit batch call per claim (split by embed_batch_size)
+        # instead of relying on the index's internal embed loop
+        # Nodes that already carry an embedding are not re-embedded
+        to_embed = [n for n in text_nodes if n.embedding is None]
+        if to_embed:
+            texts = [n.get_content(metadata_mode=MetadataMode.EMBED) for n in to_embed]
+            if len(texts) > embed_model.embed_batch_size:
+                # Several requests: send them concurrently (asyncio.gather)
+                # WHY: Embedding is network-bound; batches are independent
+                vectors = asyncio_run(
+                    embed_model.aget_text_embedding_batch(texts, show_progress=True)
+                )
+            else:
+                vectors = embed_model.get_text_embedding_batch(texts, show_progress=True)
+            for node, vector in zip(to_embed, vectors):
+                node.embedding = vector
+        
+        print(f"✅ Embedded {len(to_embed)} nodes (batch size: {embed_model.embed_batch_size})")
+        
+        # Train the quantizer if the index needs it (int8)
+        # WHY: Per-dimension ranges are learned from this claim's own vectors
+        if not faiss_index.is_trained:
+            faiss_index.train(
+                np.asarray([n.embedding for n in text_nodes], dtype=np.float32)
+            )
         
-        # Stage 5: Build VectorStoreIndex
+        # Stage 6: Build VectorStoreIndex
         # WHY: VectorStoreIndex enables similarity-based retrieval
         # CRITICAL: Pass embed_model explicitly to ensure consistency
+        # Nodes are pre-embedded, so this only adds vectors to FAISS
         self.vector_index = VectorStoreIndex(
             nodes=text_nodes,
             storage_context=self.storage_context,
             embed_model=embed_model,  # THE SINGLE EMBEDDING
-            show_progress=True,
         )
         
         print(f"✅ Built VectorStoreIndex with {len(text_nodes)} nodes")
         
-        # Stage 6: Build SummaryIndex
-        # WHY: SummaryIndex enables hierarchical summarization
-        # Used for high-level claim understanding
-        self.summary_index = SummaryIndex(
-            nodes=text_nodes,
-            embed_model=embed_model,  # THE SINGLE EMBEDDING (consistency!)
-            show_progress=True,
-        )
+        # Stage 7: Keep vectors in memory for the NumPy path (small claims)
+        # WHY: Below nodes_threshold a single sgemv beats the FAISS wrapper
+        if use_faiss is None:
+            use_faiss = len(text_nodes) >= nodes_threshold
+        if use_faiss:
+            self._matrix = None
+            self._matrix_node_ids = []
+            self._matrix_rows = {}
+            self._norms_sq = None
+        else:
+            self._matrix = np.asarray([n.embedding for n in text_nodes], dtype=np.float32)
+            self._matrix_node_ids = [n.node_id for n in text_nodes]
+            self._matrix_rows = {node_id: i for i, node_id in enumerate(self._matrix_node_ids)}
+            self._norms_sq = np.einsum('ij,ij->i', self._matrix, self._matrix)
+        
+        print(f"   Search backend: {'FAISS' if use_faiss else 'NumPy (in-memory matrix)'}")
+        
+        # Retrievers cached for a previous index must not outlive it
+        self._needle_retrievers.clear()
+        self._summary_retrievers.clear()
+        
+        # NOTE: No separate SummaryIndex
+        # WHY: It would store the same nodes a second time, and nothing reads it:
+        # summary retrieval and MapReduce both run on vector_index
         
-        print(f"✅ Built SummaryIndex with {len(text_nodes)} nodes")
         print(f"✅ Index building complete for Claim #{claim_number}")
     
+    def _apply_ef_search(self, ef_search: Optional[int], top_k: int) -> None:
+        """
+        Set the HNSW query-time beam width on the underlying FAISS index.
+        
+        WHY THIS METHOD:
+        - efSearch trades recall for latency on HNSW indexes
+        - Flat indexes are exact and have nothing to tune (no-op)
+        - efSearch below top_k would return fewer than top_k results
+        
+        Args:
+            ef_search: Beam width, or None to keep the current setting
+            top_k: Number of results the retriever will request
+        """
+        if ef_search is None or self.storage_context is None:
+            return
+        
+        hnsw = getattr(self.storage_context.vector_store.client, "hnsw", None)
+        if hnsw is not None:
+            hnsw.efSearch = max(ef_search, top_k)
+    
+    def _create_base_retriever(self, top_k: int) -> BaseRetriever:
+        """
+        Create the similarity retriever for the active search backend.
+        
+        Returns:
+            _MatrixRetriever (NumPy path) or VectorIndexRetriever (FAISS)
+        """
+        if self._matrix is not None:
+            return _MatrixRetriever(
+                matrix=self._matrix,
+                node_ids=self._matrix_node_ids,
+                index=self.vector_index,
+                similarity_top_k=top_k,
+            )
+        
+        return VectorIndexRetriever(
+            index=self.vector_index,
+            similarity_top_k=top_k,
+        )
+    
+    def _build_needle_retriever(
+        self,
+        top_k: int,
+        similarity_cutoff: Optional[float] = None,
+    ) -> AutoMergingRetriever:
+        """
+        Build (or reuse) the child → parent auto-merging retriever.
+        
+        Args:
+            top_k: Number of child chunks searched
+            similarity_cutoff: If set, child hits scoring below it are
+                               dropped BEFORE auto-merging (query_needle).
+                               None = no cutoff (get_needle_retriever)
+        
+        Returns:
+            AutoMergingRetriever, cached per (top_k, similarity_cutoff)
+        """
+        cache_key = (top_k, similarity_cutoff)
+        cached = self._needle_retrievers.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Create base vector retriever for child chunks
+        # WHY: Similarity search on child chunks (FAISS or NumPy backend)
+        # CRITICAL: Uses the embedding from vector_index (consistency!)
+        retriever = self._create_base_retriever(top_k)
+        
+        # Apply the cutoff on CHILD scores, before merging
+        # WHY: Only confident children may promote their parent; otherwise
+        # low-score children pull in junk parents that are dropped later anyway
+        if similarity_cutoff is not None:
+            retriever = _ScoreCutoffRetriever(retriever, similarity_cutoff)
+        
+        # Wrap with AutoMergingRetriever
+        # WHY: If child chunks match, automatically return parent chunks with more context
+        # This is the key pattern: Child chunks for precision → Parent chunks for context
+        auto_merging_retriever = AutoMergingRetriever(
+            retriever,
+            self.vector_index.storage_context,
+            verbose=False,  # Set to True for debugging
+        )
+        self._needle_retrievers[cache_key] = auto_merging_retriever
+        return auto_merging_retriever
+    
     def get_needle_retriever(
         self,
         top_k: int = 5,
         similarity_threshold: float = 0.7,
+        ef_search: Optional[int] = None,
+        verbose: bool = True,
     ):
         """
         Get Needle Retriever (high precision, child chunks only).
@@ -311,49 +950,50 @@ class IndexLayer:
         
         Args:
             top_k: Number of chunks to retrieve
-            similarity_threshold: Minimum similarity score (0-1)
+            similarity_threshold: Minimum cosine similarity score
+                                 (scores are cosine in [-1, 1])
                                  Only chunks above this are returned
+            ef_search: HNSW beam width (higher = better recall, slower).
+                       Ignored for exact (flat) indexes.
+            verbose: Print the configuration banner when the retriever is
+                     first built (False on query paths)
         
         Returns:
-            Configured retriever for needle queries
+            Configured retriever for needle queries (cached per top_k)
             
         WHY SIMILARITY THRESHOLD:
         - Prevents low-quality matches
         - "If not found, say so" behavior
         - Applied at QUERY TIME, not indexing time
+        
+        NOTE: The threshold is enforced by query_needle(), not by this
+        retriever. Agents receive it unfiltered, so the plain and the
+        claim-filtered (PostFilterRetriever) paths return the same kind
+        of hits.
         """
         if self.vector_index is None:
             raise ValueError("Index not built. Call build_indexes() first.")
         
-        # Create base vector retriever for child chunks
-        # WHY: VectorIndexRetriever does similarity search on child chunks
-        # CRITICAL: Uses the embedding from vector_index (consistency!)
-        base_retriever = VectorIndexRetriever(
-            index=self.vector_index,
-            similarity_top_k=top_k,
-        )
+        self._apply_ef_search(ef_search, top_k)
         
-        # Wrap with AutoMergingRetriever
-        # WHY: If child chunks match, automatically return parent chunks with more context
-        # This is the key pattern: Child chunks for precision → Parent chunks for context
-        auto_merging_retriever = AutoMergingRetriever(
-            base_retriever,
-            self.vector_index.storage_context,
-            verbose=False,  # Set to True for debugging
-        )
+        first_build = (top_k, None) not in self._needle_retrievers
+        auto_merging_retriever = self._build_needle_retriever(top_k)
         
-        print(f"🎯 Needle Retriever configured:")
-        print(f"   Mode: AUTO-MERGING (child → parent)")
-        print(f"   Top-k: {top_k} (child chunks searched)")
-        print(f"   Similarity threshold: {similarity_threshold}")
-        print(f"   Returns: Parent chunks with full context")
-        print(f"   Uses embedding: {self.embedding_model}")
+        if verbose and first_build:
+            print(f"🎯 Needle Retriever configured:")
+            print(f"   Mode: AUTO-MERGING (child → parent)")
+            print(f"   Top-k: {top_k} (child chunks searched)")
+            print(f"   Similarity threshold: {similarity_threshold}")
+            print(f"   Returns: Parent chunks with full context")
+            print(f"   Uses embedding: {self.embedding_model}")
         
         return auto_merging_retriever
     
     def get_summary_retriever(
         self,
         top_k: int = 8,
+        ef_search: Optional[int] = None,
+        verbose: bool = True,
     ):
         """
         Get Summary Retriever (high recall, parent + child chunks).
@@ -366,9 +1006,13 @@ class IndexLayer:
         
         Args:
             top_k: Number of chunks to retrieve
+            ef_search: HNSW beam width (higher = better recall, slower).
+                       Ignored for exact (flat) indexes.
+            verbose: Print the configuration banner when the retriever is
+                     first built (False on query paths)
         
         Returns:
-            Configured retriever for summary queries
+            Configured retriever for summary queries (cached per top_k)
             
         WHY NO THRESHOLD:
         - Summary queries need broad context
@@ -378,25 +1022,32 @@ class IndexLayer:
         if self.vector_index is None:
             raise ValueError("Index not built. Call build_indexes() first.")
         
+        self._apply_ef_search(ef_search, top_k)
+        
+        # Reuse the retriever built for this top_k
+        cached = self._summary_retrievers.get(top_k)
+        if cached is not None:
+            return cached
+        
         # Create base vector retriever
-        # WHY: Retrieves based on similarity
+        # WHY: Retrieves based on similarity (FAISS or NumPy backend)
         # CRITICAL: Uses the embedding from vector_index (consistency!)
-        base_retriever = VectorIndexRetriever(
-            index=self.vector_index,
-            similarity_top_k=top_k,
-        )
+        base_retriever = self._create_base_retriever(top_k)
+        self._summary_retrievers[top_k] = base_retriever
         
-        print(f"📚 Summary Retriever configured:")
-        print(f"   Scope: Parent + Child chunks")
-        print(f"   Top-k: {top_k}")
-        print(f"   Similarity threshold: None (high recall)")
-        print(f"   Uses embedding: {self.embedding_model}")
+        if verbose:
+            print(f"📚 Summary Retriever configured:")
+            print(f"   Scope: Parent + Child chunks")
+            print(f"   Top-k: {top_k}")
+            print(f"   Similarity threshold: None (high recall)")
+            print(f"   Uses embedding: {self.embedding_model}")
         
         return base_retriever
     
     def get_map_reduce_query_engine(
         self,
         top_k: int = 15,
+        use_async: bool = True,
     ):
         """
         Get MapReduce Query Engine for comprehensive summarization.
@@ -415,9 +1066,16 @@ class IndexLayer:
         
         Args:
             top_k: Number of chunks to retrieve (default 15 for comprehensive coverage)
+            use_async: Run the MAP step's LLM calls concurrently (default True)
         
         Returns:
             RetrieverQueryEngine configured with tree_summarize (MapReduce)
+        
+        WHY use_async:
+        - Each chunk is summarized independently before the reduce tree
+        - Concurrent calls: MAP takes ~1 LLM latency instead of one per chunk
+        - Works with plain query(): tree_summarize runs the async tasks
+          itself; aquery() is only needed inside an async agent loop
             
         WHY MORE CHUNKS (15 vs 8):
         - MapReduce can handle more chunks efficiently
@@ -437,10 +1095,7 @@ class IndexLayer:
         
         # Create retriever for MapReduce
         # WHY: Same vector similarity, but retrieve more chunks
-        retriever = VectorIndexRetriever(
-            index=self.vector_index,
-            similarity_top_k=top_k,
-        )
+        retriever = self._create_base_retriever(top_k)
         
         # Create MapReduce response synthesizer
         # WHY: tree_summarize = hierarchical MapReduce
@@ -448,6 +1103,7 @@ class IndexLayer:
         response_synthesizer = get_response_synthesizer(
             response_mode=ResponseMode.TREE_SUMMARIZE,
             llm=llm,
+            use_async=use_async,  # MAP step: concurrent LLM calls
             verbose=True,  # Show MAP and REDUCE steps in console
         )
         
@@ -465,6 +1121,7 @@ class IndexLayer:
         print(f"   Temperature: {self.llm_temperature}")
         print(f"   Uses embedding: {self.embedding_model}")
         print(f"   Process: Retrieve → Map → Reduce → Final Summary")
+        print(f"   Map step: {'concurrent (async)' if use_async else 'sequential'}")
         
         return query_engine
     
@@ -485,7 +1142,9 @@ class IndexLayer:
         Args:
             query: Query string
             top_k: Number of results
-            similarity_threshold: Minimum similarity
+            similarity_threshold: Minimum cosine similarity. Vectors are
+                                  L2-normalized and searched by inner
+                                  product, so scores are cosine in [-1, 1].
             
         Returns:
             List of child chunk nodes above threshold
@@ -493,25 +1152,21 @@ class IndexLayer:
         if self.vector_index is None:
             raise ValueError("Index not built. Call build_indexes() first.")
         
-        # Get retriever
-        retriever = self.get_needle_retriever(
-            top_k=top_k,
-            similarity_threshold=similarity_threshold
-        )
+        # Get retriever with the cutoff applied to child scores before merging
+        # WHY: Low-score children can no longer promote an unrelated parent
+        retriever = self._build_needle_retriever(top_k, similarity_threshold)
         
         # Retrieve
         results = retriever.retrieve(query)
         
-        # Filter for child chunks only
+        # Filter for child chunks in ONE pass
         # WHY: Needle queries need atomic facts
-        child_results = [
-            r for r in results 
+        # The threshold was already applied to child scores inside the
+        # retriever (before merging), so only the level check remains
+        return [
+            r.node for r in results
             if r.node.metadata.get('chunk_level') == 'child'
-            and r.score is not None
-            and r.score >= similarity_threshold
         ]
-        
-        return [r.node for r in child_results]
     
     def query_summary(
         self,
@@ -537,13 +1192,125 @@ class IndexLayer:
             raise ValueError("Index not built. Call build_indexes() first.")
         
         # Get retriever
-        retriever = self.get_summary_retriever(top_k=top_k)
+        # WHY verbose=False: This runs on every query; the banner is setup output
+        retriever = self.get_summary_retriever(top_k=top_k, verbose=False)
         
         # Retrieve
         results = retriever.retrieve(query)
         
         return [r.node for r in results]
     
+    def query_batch(
+        self,
+        queries: List[str],
+        top_k: int = 8,
+    ) -> List[List[BaseNode]]:
+        """
+        Execute many summary-style queries in ONE search call.
+        
+        WHY THIS METHOD:
+        - Query embeddings are fetched concurrently (and hit the query LRU)
+        - All queries are searched together: one FAISS search(Q, k) or one
+          NumPy matrix product, instead of one call per query
+        - FAISS gets more OpenMP threads just for this call, where there
+          is enough work per thread to pay for them
+        
+        Args:
+            queries: Query strings
+            top_k: Number of results per query
+        
+        Returns:
+            One list of nodes per query (same order as queries),
+            like query_summary (no threshold, no auto-merging)
+        """
+        if self.vector_index is None:
+            raise ValueError("Index not built. Call build_indexes() first.")
+        
+        if not queries:
+            return []
+        
+        # Embed all queries concurrently
+        embed_model = self._get_or_create_embedding()
+        
+        async def embed_all() -> List[List[float]]:
+            return await asyncio.gather(
+                *(embed_model.aget_query_embedding(q) for q in queries)
+            )
+        
+        query_matrix = np.ascontiguousarray(asyncio_run(embed_all()), dtype=np.float32)
+        
+        if self._matrix is not None:
+            # NumPy path: one GEMM for all queries
+            scores = query_matrix @ self._matrix.T
+            k = min(top_k, scores.shape[1])
+            if k == 0:
+                return [[] for _ in queries]
+            top = np.argpartition(scores, -k, axis=1)[:, -k:]
+            order = np.take_along_axis(scores, top, axis=1).argsort(axis=1)[:, ::-1]
+            top = np.take_along_axis(top, order, axis=1)
+            node_ids_per_query = [
+                [self._matrix_node_ids[i] for i in row] for row in top
+            ]
+        else:
+            # FAISS path: one search() call, more threads just for this block
+            faiss_index = self.storage_context.vector_store.client
+            faiss.omp_set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+            try:
+                _, ids = faiss_index.search(query_matrix, top_k)
+            finally:
+                faiss.omp_set_num_threads(self.faiss_threads)
+            
+            # FAISS row position → node id (as recorded by VectorStoreIndex)
+            nodes_dict = self.vector_index.index_struct.nodes_dict
+            node_ids_per_query = [
+                [nodes_dict[str(i)] for i in row if i != -1] for row in ids
+            ]
+        
+        docstore = self.vector_index.docstore
+        return [docstore.get_nodes(node_ids) for node_ids in node_ids_per_query]
+    
+    def rerank_nodes(
+        self,
+        query_embedding: List[float],
+        node_ids: List[str],
+    ) -> List[Tuple[str, float]]:
+        """
+        Exact re-ranking of candidate nodes by squared L2 distance.
+        
+        WHY THIS METHOD:
+        - Building block for hybrid search (approximate recall → exact rerank)
+        - d²(q,x) = ||q||² + ||x||² − 2·q·x with ||x||² cached at build time:
+          one gather + one matrix-vector product, no per-node Python math
+        - On unit vectors d² = 2 − 2·cosine, so the order matches cosine
+        
+        Args:
+            query_embedding: Query vector (from the SAME embedding model)
+            node_ids: Candidate node ids (must be in this index)
+        
+        Returns:
+            (node_id, squared distance) pairs, closest first
+        """
+        if self._matrix is None or self._norms_sq is None:
+            raise ValueError(
+                "rerank_nodes needs the in-memory vectors. "
+                "Build with use_faiss=False (or below nodes_threshold)."
+            )
+        
+        if not node_ids:
+            return []
+        
+        rows = np.fromiter(
+            (self._matrix_rows[node_id] for node_id in node_ids),
+            dtype=np.intp,
+            count=len(node_ids),
+        )
+        query = np.asarray(query_embedding, dtype=np.float32)
+        
+        dist_sq = self._norms_sq[rows] + query @ query - 2.0 * (self._matrix[rows] @ query)
+        order = np.argsort(dist_sq, kind='stable')
+        
+        return [(node_ids[i], float(dist_sq[i])) for i in order]
+    
     def save(self, persist_dir: str) -> None:
         """
         Save indexes and metadata to disk.
@@ -559,7 +1326,7 @@ class IndexLayer:
         CRITICAL:
         - Saves StorageContext (includes embedding config)
         - Saves vector index
-        - Saves metadata
+        - Saves metadata (incl. the index format marker checked by load())
         - Loading will restore the SAME embedding setup
         """
         if self.vector_index is None or self.storage_context is None:
@@ -570,7 +1337,18 @@ class IndexLayer:
         
         # Save vector index
         # WHY: Persists FAISS index + metadata
-        self.storage_context.persist(persist_dir=str(persist_path))
+        # Vector store files are written under a temporary name, then swapped
+        # in with os.replace (atomic rename)
+        # WHY: Processes that load() with mmap map the FAISS file directly;
+        # rewriting it in place would change vectors under their feet.
+        # After a rename they keep the old (unlinked) file until they reload
+        self.storage_context.persist(
+            persist_dir=str(persist_path),
+            vector_store_fname=f"{DEFAULT_PERSIST_FNAME}.tmp",
+        )
+        for namespace in self.storage_context.vector_stores:
+            final_path = persist_path / f"{namespace}{NAMESPACE_SEP}{DEFAULT_PERSIST_FNAME}"
+            os.replace(f"{final_path}.tmp", final_path)
         
         # Save claim metadata
         # WHY: Need to know which claim this index belongs to
@@ -579,6 +1357,7 @@ class IndexLayer:
             "claim_number": self.claim_number,
             "embedding_model": self.embedding_model,
             "vector_dimension": self.vector_dimension,
+            "index_format": _INDEX_FORMAT,
         }
         
         metadata_path = persist_path / "index_metadata.json"
@@ -590,7 +1369,7 @@ class IndexLayer:
         print(f"   Embedding: {self.embedding_model}")
     
     @classmethod
-    def load(cls, persist_dir: str) -> 'IndexLayer':
+    def load(cls, persist_dir: str, mmap: bool = True) -> 'IndexLayer':
         """
         Load indexes from disk.
         
@@ -601,6 +1380,9 @@ class IndexLayer:
         
         Args:
             persist_dir: Directory containing saved indexes
+            mmap: Memory-map the FAISS file instead of reading and copying it
+                  (near-instant load, vectors paged in on demand).
+                  The loaded index is read-only: do not add nodes to it.
             
         Returns:
             IndexLayer instance with loaded indexes
@@ -609,6 +1391,8 @@ class IndexLayer:
         - Recreates the SAME embedding model
         - Loads StorageContext (contains FAISS)
         - Maintains embedding consistency
+        - Raises ValueError for indexes saved in an older format
+          (e.g. IndexFlatL2): rebuild them with build_production_index.py
         """
         persist_path = Path(persist_dir)
         
@@ -623,6 +1407,16 @@ class IndexLayer:
         with open(metadata_path, 'r') as f:
             metadata = json.load(f)
         
+        # Refuse indexes with another metric / unnormalized vectors
+        # WHY: Their scores are not cosine, so thresholds would silently misfire
+        index_format = metadata.get('index_format')
+        if index_format != _INDEX_FORMAT:
+            raise ValueError(
+                f"Index at {persist_dir} has format {index_format!r}, "
+                f"expected {_INDEX_FORMAT!r} (inner product on normalized vectors). "
+                f"Rebuild it with build_production_index.py"
+            )
+        
         # Create instance with SAME embedding configuration
         # WHY: Ensures embedding consistency
         instance = cls(
@@ -640,12 +1434,26 @@ class IndexLayer:
         # Load FAISS vector store from disk
         # WHY: FAISS data was persisted and needs to be loaded properly
         # CRITICAL: This loads the actual vectors, not just an empty index
-        vector_store = FaissVectorStore.from_persist_dir(persist_dir=str(persist_path))
+        if mmap:
+            # Zero-copy: vectors stay in the page cache, load is O(open + mmap)
+            faiss_path = persist_path / _FAISS_PERSIST_FNAME
+            if not faiss_path.exists():
+                raise ValueError(f"FAISS index not found: {faiss_path}")
+            raw_index = faiss.read_index(str(faiss_path), _FAISS_MMAP_FLAGS)
+            vector_store = FaissVectorStore(faiss_index=raw_index)
+        else:
+            vector_store = FaissVectorStore.from_persist_dir(persist_dir=str(persist_path))
+        
+        # Pin FAISS's OpenMP thread count (process-wide setting)
+        faiss.omp_set_num_threads(instance.faiss_threads)
         
         # Load storage context with the loaded FAISS vector store
         # WHY: Connects all components together
+        # graph_store: VectorStoreIndex never uses it, so an empty in-memory
+        # store replaces parsing graph_store.json on every load
         instance.storage_context = StorageContext.from_defaults(
             vector_store=vector_store,
+            graph_store=SimpleGraphStore(),
             persist_dir=str(persist_path),
         )
         
@@ -667,14 +1475,57 @@ class IndexLayer:
         print(f"✅ Loaded indexes from: {persist_dir}")
         print(f"   Claim #{instance.claim_number}")
         print(f"   Embedding: {instance.embedding_model}")
+        print(f"   FAISS load: {'mmap (read-only)' if mmap else 'in-memory copy'}")
         
         return instance
+    
+    @classmethod
+    def load_many(cls, root_dir: str, mmap: bool = True) -> Dict[str, 'IndexLayer']:
+        """
+        Load every per-claim index saved under one root directory.
+        
+        WHY THIS METHOD:
+        - Multi-claim deployments keep one saved index per claim
+          (root_dir/<claim>/index_metadata.json + stores + FAISS file)
+        - One call instead of a hand-written loop over load()
+        - FAISS files are memory-mapped by default (near-instant per claim)
+        
+        Args:
+            root_dir: Directory whose subdirectories were written by save()
+            mmap: Memory-map each FAISS file (see load())
+        
+        Returns:
+            Dict of subdirectory name → loaded IndexLayer (sorted by name)
+        
+        CRITICAL:
+        - Each claim keeps its OWN docstore/index_store (claim isolation);
+          save() writes them per claim, so there is nothing shared to reuse
+        """
+        root_path = Path(root_dir)
+        
+        if not root_path.is_dir():
+            raise ValueError(f"Index root directory not found: {root_dir}")
+        
+        claim_dirs = sorted(
+            p for p in root_path.iterdir()
+            if (p / "index_metadata.json").is_file()
+        )
+        
+        layers = {
+            claim_dir.name: cls.load(str(claim_dir), mmap=mmap)
+            for claim_dir in claim_dirs
+        }
+        
+        print(f"✅ Loaded {len(layers)} claim indexes from: {root_dir}")
+        
+        return layers
 
 
 # Production-ready factory function
 def create_index_layer(
     embedding_model: str = "text-embedding-3-small",
     vector_dimension: int = 1536,
+    embedding_cache_path: Optional[str] = _EMBEDDING_CACHE_PATH,
 ) -> IndexLayer:
     """
     Factory function to create an index layer.
@@ -684,6 +1535,8 @@ def create_index_layer(
     Args:
         embedding_model: OpenAI embedding model name
         vector_dimension: Embedding dimension
+        embedding_cache_path: SQLite file for cached document embeddings
+                              (None disables the cache)
         
     Returns:
         Configured IndexLayer instance
@@ -691,6 +1544,7 @@ def create_index_layer(
     return IndexLayer(
         embedding_model=embedding_model,
         vector_dimension=vector_dimension,
+        embedding_cache_path=embedding_cache_path,
     )
 
 
@@ -714,6 +1568,7 @@ class ClaimIndexManager:
         self,
         embedding_model: str = "text-embedding-3-small",
         vector_dimension: int = 1536,
+        max_workers: int = 1,
     ):
         """
         Initialize the claim index manager.
@@ -721,9 +1576,12 @@ class ClaimIndexManager:
         Args:
             embedding_model: OpenAI embedding model name
             vector_dimension: Embedding dimension
+            max_workers: Threads used to chunk claims in parallel when
+                         index_all_claims=True (default 1)
         """
         self.embedding_model = embedding_model
         self.vector_dimension = vector_dimension
+        self.max_workers = max_workers
         self.index_layer: Optional[IndexLayer] = None
     
     def build_index(
@@ -732,6 +1590,7 @@ class ClaimIndexManager:
         persist_dir: str = "storage",
         claim_index: int = 0,
         index_all_claims: bool = False,
+        quantization: Optional[str] = None,
     ) -> None:
         """
         Build index from a PDF file (complete pipeline).
@@ -749,6 +1608,9 @@ class ClaimIndexManager:
             claim_index: Which claim to process (default: 0, first claim)
                         Ignored if index_all_claims=True
             index_all_claims: If True, indexes ALL claims in the PDF (default: False)
+            quantization: FAISS vector storage, passed to build_indexes():
+                          "int8" (scalar quantizer, 1/4 the bytes per
+                          distance), "fp16" (1/2), or None for exact fp32
         
         WHY THIS METHOD:
         - One-line setup for demos and quickstarts
@@ -800,12 +1662,19 @@ class ClaimIndexManager:
             child_chunk_size=120,
         )
         
+        # Claims are independent (no shared state in build_nodes)
+        if self.max_workers > 1 and len(claims_to_process) > 1:
+            # map() preserves claim order → deterministic node order
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(claims_to_process))) as executor:
+                nodes_per_claim = list(executor.map(chunking_pipeline.build_nodes, claims_to_process))
+        else:
+            nodes_per_claim = [chunking_pipeline.build_nodes(claim) for claim in claims_to_process]
+        
         all_nodes = []
-        for claim in claims_to_process:
-            claim_num = claim.metadata.get('claim_number', 'unknown')
-            nodes = chunking_pipeline.build_nodes(claim)
+        for claim, nodes in zip(claims_to_process, nodes_per_claim):
             all_nodes.extend(nodes)
             if index_all_claims:
+                claim_num = claim.metadata.get('claim_number', 'unknown')
                 print(f"   ✓ Claim #{claim_num}: {len(nodes)} nodes")
         
         print(f"✅ Created {len(all_nodes)} total hierarchical nodes")
@@ -829,6 +1698,7 @@ class ClaimIndexManager:
             nodes=all_nodes,
             claim_id=claim_id,
             claim_number=claim_number,
+            quantization=quantization,
         )
         print(f"✅ Indexes built")
         
@@ -857,13 +1727,19 @@ class ClaimIndexManager:
         self.index_layer = IndexLayer.load(persist_dir=persist_dir)
         print(f"✅ Index loaded and ready")
     
-    def get_needle_retriever(self, top_k: int = 5, similarity_threshold: float = 0.7):
+    def get_needle_retriever(
+        self,
+        top_k: int = 5,
+        similarity_threshold: float = 0.7,
+        ef_search: Optional[int] = None,
+    ):
         """
         Get Needle Retriever (high precision, child chunks only).
         
         Args:
             top_k: Number of chunks to retrieve
             similarity_threshold: Minimum similarity score
+            ef_search: HNSW beam width (ignored for exact indexes)
             
         Returns:
             Configured retriever for needle queries
@@ -873,15 +1749,17 @@ class ClaimIndexManager:
         
         return self.index_layer.get_needle_retriever(
             top_k=top_k,
-            similarity_threshold=similarity_threshold
+            similarity_threshold=similarity_threshold,
+            ef_search=ef_search,
         )
     
-    def get_summary_retriever(self, top_k: int = 8):
+    def get_summary_retriever(self, top_k: int = 8, ef_search: Optional[int] = None):
         """
         Get Summary Retriever (high recall, parent + child chunks).
         
         Args:
             top_k: Number of chunks to retrieve
+            ef_search: HNSW beam width (ignored for exact indexes)
             
         Returns:
             Configured retriever for summary queries
@@ -889,9 +1767,9 @@ class ClaimIndexManager:
         if self.index_layer is None:
             raise ValueError("Index not loaded. Call build_index() or load_index() first.")
         
-        return self.index_layer.get_summary_retriever(top_k=top_k)
+        return self.index_layer.get_summary_retriever(top_k=top_k, ef_search=ef_search)
     
-    def get_map_reduce_query_engine(self, top_k: int = 15):
+    def get_map_reduce_query_engine(self, top_k: int = 15, use_async: bool = True):
         """
         Get MapReduce Query Engine for comprehensive summarization.
         
@@ -903,6 +1781,7 @@ class ClaimIndexManager:
         
         Args:
             top_k: Number of chunks to retrieve (default 15 for comprehensive coverage)
+            use_async: Run the MAP step's LLM calls concurrently (default True)
             
         Returns:
             RetrieverQueryEngine configured with tree_summarize (MapReduce)
@@ -910,5 +1789,5 @@ class ClaimIndexManager:
         if self.index_layer is None:
             raise ValueError("Index not loaded. Call build_index() or load_index() first.")
         
-        return self.index_layer.get_map_reduce_query_engine(top_k=top_k)
+        return self.index_layer.get_map_reduce_query_engine(top_k=top_k, use_async=use_async)
 
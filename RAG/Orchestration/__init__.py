@@ -32,7 +32,7 @@ Usage:
     # -> {"route": "needle", "answer": "CLM-2024-00789", ...}
 """
 
-from .orchestrator import Orchestrator
+from .orchestrator import Orchestrator, RagResponse
 
-__all__ = ["Orchestrator"]
+__all__ = ["Orchestrator", "RagResponse"]
 
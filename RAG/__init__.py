@@ -10,7 +10,7 @@ A modular, scalable RAG system built with:
 Architecture:
 1. PDF Ingestion Layer - PDF → Document
 2. Chunking Layer - Document → Hierarchical Nodes
-3. Index Layer - Nodes → VectorStoreIndex + SummaryIndex
+3. Index Layer - Nodes → VectorStoreIndex (FAISS) + Retrievers
 4. Agents Layer - Router + Needle + Summary agents
 5. Orchestration Layer - LangChain pipeline
 """